@@ -298,7 +298,8 @@ def main() -> int:
         "",
         "import pytest",
         "",
-        "from tests.notebook_grader import exec_tagged_code",
+        "from tests.notebook_grader import exec_tagged_code"
+        + (", load_cells_by_tag" if args.type == "debug" else ""),
         "",
         "",
         "def _run(tag: str):",
@@ -332,15 +333,11 @@ def main() -> int:
     if args.type == "debug":
         test_lines += [
             "# Explanation cell checks for debug exercises",
-            "import json",
-            "",
             "def _get_explanation(notebook_path: str, tag: str = 'explanation1') -> str:",
-            "    nb = json.load(open(notebook_path, 'r', encoding='utf-8'))",
-            "    for cell in nb.get('cells', []):",
-            "        tags = cell.get('metadata', {}).get('tags', [])",
-            "        if tag in tags:",
-            "            return ''.join(cell.get('source', []))",
-            "    raise AssertionError(f'No explanation cell with tag {tag}')",
+            "    cell = load_cells_by_tag(notebook_path).get(tag)",
+            "    if cell is None:",
+            "        raise AssertionError(f'No explanation cell with tag {tag}')",
+            "    return ''.join(cell.get('source', []))",
             "",
         ]
         if args.parts == 1:
@@ -352,7 +349,6 @@ def main() -> int:
             ]
         else:
             test_lines += [
-                "import pytest",
                 f"TAGS = [f'explanation{{i}}' for i in range(1, {args.parts} + 1)]",
                 "@pytest.mark.parametrize('tag', TAGS)",
                 "def test_explanations_have_content(tag: str) -> None:",
@@ -365,10 +361,12 @@ def main() -> int:
 
     # Build notebook with the optional exercise type (e.g., debug)
     notebook = _make_notebook_with_parts(args.title, parts=args.parts, exercise_type=args.type)
-    nb_path.write_text(json.dumps(notebook, indent=2), encoding="utf-8")
+    # The solution mirror starts as a copy of the student notebook
+    notebook_json = json.dumps(notebook, indent=2)
+    nb_path.write_text(notebook_json, encoding="utf-8")
 
     nb_solution_path.parent.mkdir(parents=True, exist_ok=True)
-    nb_solution_path.write_text(json.dumps(notebook, indent=2), encoding="utf-8")
+    nb_solution_path.write_text(notebook_json, encoding="utf-8")
 
     # If this is a debug exercise, update README to mention explanation tags
     if args.type == "debug":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import shutil
@@ -10,16 +11,33 @@ import subprocess
 import sys
 import traceback
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from scripts.template_repo_cli.core.collector import FileCollector
-from scripts.template_repo_cli.core.github import GitHubClient
-from scripts.template_repo_cli.core.packager import TemplatePackager
-from scripts.template_repo_cli.core.selector import ExerciseSelector
 from scripts.template_repo_cli.utils.validation import (
     sanitize_repo_name,
     validate_repo_name,
 )
 
+# The core modules are imported inside the command handlers so `--help` and
+# argument errors don't pay for them
+if TYPE_CHECKING:
+    from scripts.template_repo_cli.core.collector import FileCollector
+    from scripts.template_repo_cli.core.github import GitHubClient
+    from scripts.template_repo_cli.core.packager import TemplatePackager
+    from scripts.template_repo_cli.core.selector import ExerciseSelector
+
+
+def _progress(message: str) -> None:
+    """Print a progress line and flush it immediately.
+
+    stdout is block-buffered when piped (e.g. CI logs), so without the flush
+    progress only appears once the run finishes.
+
+    Args:
+        message: Line to print.
+    """
+    print(message, flush=True)
+
 
 def get_repo_root() -> Path:
     """Get repository root directory."""
@@ -245,7 +263,7 @@ def _build_template_package(
         return False
 
     if verbose:
-        print("Package validated successfully")
+        _progress("Package validated successfully")
 
     return True
 
@@ -301,7 +319,7 @@ def _attempt_github_repo_creation(
     )
 
     if result["success"]:
-        print(f"✓ Created repository: {args.repo_name}")
+        _progress(f"✓ Created repository: {args.repo_name}")
         return True, None
 
     return False, result.get("error") or "Unknown error"
@@ -399,7 +417,7 @@ def _prepare_exercises(
         return None, None
 
     if args.verbose:
-        print(f"Selected {len(exercises)} exercises: {', '.join(exercises)}")
+        _progress(f"Selected {len(exercises)} exercises: {', '.join(exercises)}")
 
     # Collect files
     try:
@@ -542,7 +560,12 @@ def create_command(args: argparse.Namespace) -> int:
         return 1
 
     if args.verbose:
-        print(f"Repository root: {repo_root}")
+        _progress(f"Repository root: {repo_root}")
+
+    from scripts.template_repo_cli.core.collector import FileCollector
+    from scripts.template_repo_cli.core.github import GitHubClient
+    from scripts.template_repo_cli.core.packager import TemplatePackager
+    from scripts.template_repo_cli.core.selector import ExerciseSelector
 
     # Initialize components
     selector = ExerciseSelector(repo_root)
@@ -558,7 +581,7 @@ def create_command(args: argparse.Namespace) -> int:
     # Create workspace
     workspace = packager.create_workspace()
     if args.verbose:
-        print(f"Created workspace: {workspace}")
+        _progress(f"Created workspace: {workspace}")
 
     # Execute template creation
     return _execute_template_creation(args, workspace, packager, github, files, exercises)
@@ -611,6 +634,8 @@ def list_command(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success).
     """
+    from scripts.template_repo_cli.core.selector import ExerciseSelector
+
     repo_root = get_repo_root()
     selector = ExerciseSelector(repo_root)
 
@@ -656,6 +681,9 @@ def validate_command(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success).
     """
+    from scripts.template_repo_cli.core.collector import FileCollector
+    from scripts.template_repo_cli.core.selector import ExerciseSelector
+
     repo_root = get_repo_root()
     selector = ExerciseSelector(repo_root)
     collector = FileCollector(repo_root)
@@ -691,14 +719,12 @@ def validate_command(args: argparse.Namespace) -> int:
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point.
-
-    Args:
-        argv: Command-line arguments (defaults to sys.argv[1:]).
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once; parse_args keeps no state on it).
 
     Returns:
-        Exit code.
+        Configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Create GitHub template repositories from exercise subsets"
@@ -762,6 +788,20 @@ def main(argv: list[str] | None = None) -> int:
     validate_parser.add_argument("--type", nargs="+", help="Filter by type")
     validate_parser.add_argument("--notebooks", nargs="+", help="Specific notebook patterns")
 
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code.
+    """
+    parser = _build_parser()
+
     # Parse arguments
     args = parser.parse_args(argv)
 
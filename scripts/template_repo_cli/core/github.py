@@ -1,23 +1,118 @@
-"""GitHub operations."""
+"""GitHub operations.
+
+If the optional ``orjson`` package is installed it is used to parse gh's JSON
+output; otherwise the stdlib ``json`` module is used.
+"""
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shlex
+import shutil
 import subprocess
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+
+# Lifetime of gh's on-disk cache for read-only `gh api` GETs
+GH_API_CACHE_TTL = "1h"
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_gh() -> str | None:
+    """Locate the gh executable on PATH.
+
+    The lookup is cached for the life of the process, since PATH and the gh
+    install don't change mid-run.
+
+    Returns:
+        Path to gh, or None if it is not on PATH.
+    """
+    return shutil.which("gh")
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_bash() -> str | None:
+    """Locate bash on PATH (cached), used to batch commands into one process.
+
+    Batching is POSIX-only: on Windows the bash on PATH is often WSL's, which
+    would run git in a separate Linux environment.
+
+    Returns:
+        Path to bash, or None if it is not available or not on POSIX.
+    """
+    if os.name != "posix":
+        return None
+    return shutil.which("bash")
+
+
+def _batch_script(cmds: list[list[str]]) -> str:
+    """Build a bash script running commands in order until one fails.
+
+    Output of successful commands is discarded. On failure the script prints
+    the failing command's index on the first line of stdout, followed by that
+    command's combined stdout and stderr, and exits with its return code.
+
+    Args:
+        cmds: Commands as lists of strings.
+
+    Returns:
+        Script for ``bash -c``.
+    """
+    return "\n".join(
+        f'out=$({shlex.join(cmd)} 2>&1) || {{ rc=$?; printf \'%s\\n%s\' {index} "$out"; exit $rc; }}'
+        for index, cmd in enumerate(cmds)
+    )
+
+
+def _step_failure(cmd: list[str], output: str, returncode: int | None) -> dict[str, Any]:
+    """Build the result for a failed batch step.
+
+    Args:
+        cmd: The command that failed.
+        output: What the command printed (stderr, or stdout if stderr was empty).
+        returncode: The command's exit status (None if it could not be run).
+
+    Returns:
+        Result dictionary naming the failed command.
+    """
+    failed_command = shlex.join(cmd)
+    return {
+        "success": False,
+        "output": output,
+        "error": f"{failed_command} failed:\n{output.strip()}",
+        "returncode": returncode,
+        "failed_command": failed_command,
+    }
+
 
 class GitHubClient:
     """GitHub operations client."""
 
-    def __init__(self, dry_run: bool = False):
+    _BASE_CREATE: tuple[str, ...] = ("gh", "repo", "create")
+
+    def __init__(self, dry_run: bool = False, ttl_seconds: float = 300):
         """Initialize GitHub client.
         
         Args:
             dry_run: If True, don't execute commands.
+            ttl_seconds: How long gh install/auth check results are reused.
         """
         self.dry_run = dry_run
+        self.ttl_seconds = ttl_seconds
+        # Check name -> (result, monotonic expiry time)
+        self._status_cache: dict[str, tuple[bool, float]] = {}
+        # Authenticated login, looked up once per client via `gh api user`
+        self._login: str | None = None
 
     def build_create_command(
         self,
@@ -42,19 +137,12 @@ class GitHubClient:
         Returns:
             Command as list of strings.
         """
-        cmd = ["gh", "repo", "create"]
-        
-        # Add repo name (with org prefix if specified)
-        if org:
-            cmd.append(f"{org}/{repo_name}")
-        else:
-            cmd.append(repo_name)
-        
-        # Add visibility flag
-        if public:
-            cmd.append("--public")
-        else:
-            cmd.append("--private")
+        # Repo name (with org prefix if specified) and visibility flag
+        cmd = [
+            *self._BASE_CREATE,
+            f"{org}/{repo_name}" if org else repo_name,
+            "--public" if public else "--private",
+        ]
         
         # Add template flag only when a source template repository is specified
         if template_repo:
@@ -93,12 +181,98 @@ class GitHubClient:
         except (OSError, subprocess.SubprocessError) as e:
             return {"success": False, "error": str(e)}
 
+    def _run_batch(self, cmds: list[list[str]], cwd: Path | None = None) -> dict[str, Any]:
+        """Run commands in order, stopping at the first failure.
+        
+        With bash available (POSIX only) the commands run as a single process
+        instead of one process per command.
+        
+        Args:
+            cmds: Commands as lists of strings.
+            cwd: Working directory for every command.
+            
+        Returns:
+            Dictionary with 'success', 'output', 'error' and 'returncode'. On
+            failure 'failed_command' names the failing command and 'error'
+            includes its output (stdout when it printed nothing to stderr).
+        """
+        if len(cmds) > 1 and _locate_bash() is not None:
+            return self._run_in_bash(cmds, cwd)
+        
+        for cmd in cmds:
+            try:
+                completed = subprocess.run(
+                    cmd, cwd=cwd, capture_output=True, text=True, check=False
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                return _step_failure(cmd, str(e), None)
+            if completed.returncode != 0:
+                return _step_failure(cmd, completed.stderr or completed.stdout, completed.returncode)
+        return {"success": True, "output": "", "error": "", "returncode": 0}
+
+    def _run_in_bash(self, cmds: list[list[str]], cwd: Path | None) -> dict[str, Any]:
+        """Run commands as one bash process (see `_run_batch`).
+        
+        Args:
+            cmds: Commands as lists of strings.
+            cwd: Working directory for every command.
+            
+        Returns:
+            Result dictionary, as for `_run_batch`.
+        """
+        try:
+            completed = subprocess.run(
+                ["bash", "-c", _batch_script(cmds)],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            return {"success": False, "error": str(e)}
+        if completed.returncode == 0:
+            return {"success": True, "output": "", "error": "", "returncode": 0}
+        
+        index, _, output = completed.stdout.partition("\n")
+        if index.isdigit() and int(index) < len(cmds):
+            return _step_failure(cmds[int(index)], output, completed.returncode)
+        # bash itself failed before reaching any command
+        return {
+            "success": False,
+            "output": completed.stdout,
+            "error": completed.stderr or completed.stdout,
+            "returncode": completed.returncode,
+        }
+
+    def _cached_status(self, key: str, probe: Callable[[], bool]) -> bool:
+        """Return a cached check result, re-running the probe once it expires.
+        
+        Args:
+            key: Cache key for the check.
+            probe: Callable performing the actual check.
+            
+        Returns:
+            The (possibly cached) check result.
+        """
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        value = probe()
+        self._status_cache[key] = (value, now + self.ttl_seconds)
+        return value
+
     def check_gh_installed(self) -> bool:
-        """Check if gh CLI is installed.
+        """Check if gh CLI is installed (cached for ``ttl_seconds``).
         
         Returns:
             True if installed, False otherwise.
         """
+        return self._cached_status("gh_installed", self._probe_gh_installed)
+
+    def _probe_gh_installed(self) -> bool:
+        if _locate_gh() is None:
+            return False
         try:
             result = subprocess.run(
                 ["gh", "--version"], capture_output=True, check=False
@@ -108,11 +282,14 @@ class GitHubClient:
             return False
 
     def check_authentication(self) -> bool:
-        """Check gh authentication status.
+        """Check gh authentication status (cached for ``ttl_seconds``).
         
         Returns:
             True if authenticated, False otherwise.
         """
+        return self._cached_status("gh_authenticated", self._probe_authentication)
+
+    def _probe_authentication(self) -> bool:
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"], capture_output=True, check=False
@@ -199,8 +376,10 @@ class GitHubClient:
             ValueError: If output is not valid JSON.
         """
         try:
+            if orjson is not None:
+                return orjson.loads(output)
             return json.loads(output)
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # both parsers' decode errors subclass ValueError
             raise ValueError(f"Invalid JSON: {e}") from e
 
     def create_repository(
@@ -237,14 +416,6 @@ class GitHubClient:
                 "message": "Dry run - no repository created",
             }
         
-        # Only do git operations on first attempt
-        if not skip_git_operations:
-            # Initialize git repository in workspace (required for --source flag)
-            self.init_git_repo(workspace)
-            
-            # Commit files (required for --push flag)
-            self.commit_files(workspace, "Initial commit")
-        
         # Build create command with workspace as source
         cmd = self.build_create_command(
             repo_name,
@@ -255,7 +426,23 @@ class GitHubClient:
             source_path=str(workspace),
         )
         
-        # Execute command (this will create repo and push files)
+        # Only do git operations on first attempt (retries reuse the commit)
+        if not skip_git_operations:
+            # git init/add/commit (required for --source/--push) run as one batch
+            git_result = self._run_batch(
+                [
+                    ["git", "init"],
+                    *self._local_identity_commands(),
+                    ["git", "add", "."],
+                    ["git", "commit", "-m", "Initial commit"],
+                ],
+                cwd=workspace,
+            )
+            if not git_result["success"]:
+                return git_result
+        
+        # Execute command on its own so its error text is gh's alone
+        # (this will create repo and push files)
         result = self.execute_command(cmd)
         
         # Mark repository as a template if requested
@@ -287,20 +474,21 @@ class GitHubClient:
         if org:
             repo_ref = f"{org}/{repo_name}"
         else:
-            # Get authenticated user
-            user_result = subprocess.run(
-                ["gh", "api", "user", "--jq", ".login"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if user_result.returncode != 0:
-                return {
-                    "success": False,
-                    "error": f"Failed to get authenticated user: {user_result.stderr}",
-                }
-            username = user_result.stdout.strip()
-            repo_ref = f"{username}/{repo_name}"
+            # Get authenticated user (cached: it cannot change for this client)
+            if self._login is None:
+                user_result = subprocess.run(
+                    ["gh", "api", "user", "--cache", GH_API_CACHE_TTL, "--jq", ".login"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                if user_result.returncode != 0:
+                    return {
+                        "success": False,
+                        "error": f"Failed to get authenticated user: {user_result.stderr}",
+                    }
+                self._login = user_result.stdout.strip()
+            repo_ref = f"{self._login}/{repo_name}"
         
         cmd = ["gh", "repo", "edit", repo_ref, "--template"]
         return self.execute_command(cmd)
@@ -315,6 +503,39 @@ class GitHubClient:
             ["git", "init"], cwd=workspace, capture_output=True, check=True
         )
 
+    def _global_git_identity(self) -> dict[str, str]:
+        """Read the global git user.name and user.email in a single call.
+        
+        Returns:
+            Mapping of the keys that are set (e.g. 'user.name') to their values.
+        """
+        result = subprocess.run(
+            ["git", "config", "--global", "--get-regexp", r"^user\.(name|email)$"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        identity: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(" ")
+            if value.strip():
+                identity[key] = value.strip()
+        return identity
+
+    def _local_identity_commands(self) -> list[list[str]]:
+        """Build git config commands for identity keys missing globally.
+        
+        Returns:
+            Commands setting a fallback user.name/user.email in the repository.
+        """
+        identity = self._global_git_identity()
+        cmds: list[list[str]] = []
+        if not identity.get("user.name"):
+            cmds.append(["git", "config", "user.name", "Template CLI"])
+        if not identity.get("user.email"):
+            cmds.append(["git", "config", "user.email", "template-cli@example.com"])
+        return cmds
+
     def commit_files(self, workspace: Path, message: str) -> None:
         """Commit files.
         
@@ -325,36 +546,9 @@ class GitHubClient:
         Raises:
             RuntimeError: If git user configuration is missing or commit fails.
         """
-        # Check if git is configured globally
-        user_name = subprocess.run(
-            ["git", "config", "--global", "user.name"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        user_email = subprocess.run(
-            ["git", "config", "--global", "user.email"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        
         # If global config is missing, set local config in workspace
-        if not user_name.stdout.strip():
-            subprocess.run(
-                ["git", "config", "user.name", "Template CLI"],
-                cwd=workspace,
-                capture_output=True,
-                check=True,
-            )
-        
-        if not user_email.stdout.strip():
-            subprocess.run(
-                ["git", "config", "user.email", "template-cli@example.com"],
-                cwd=workspace,
-                capture_output=True,
-                check=True,
-            )
+        for cmd in self._local_identity_commands():
+            subprocess.run(cmd, cwd=workspace, capture_output=True, check=True)
         
         # Add all files
         add_result = subprocess.run(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from scripts.template_repo_cli.utils.filesystem import (
@@ -11,6 +12,41 @@ from scripts.template_repo_cli.utils.filesystem import (
     safe_copy_file,
 )
 
+# Upper bound on threads copying exercise files (the copies are I/O-bound)
+MAX_COPY_WORKERS = 8
+
+# Files and directories copied from template_repo_files/ into every template
+_TEMPLATE_BASE_FILES = ("pyproject.toml", "pytest.ini", ".gitignore", "INSTRUCTIONS.md")
+_TEMPLATE_BASE_DIRS = (".vscode", ".github")
+
+
+def _template_base_sources(repo_root: Path) -> tuple[tuple[Path, str, bool], ...]:
+    """List the template base sources that currently exist.
+    
+    Args:
+        repo_root: Root directory of the repository.
+        
+    Returns:
+        Tuples of (source path, destination relative to the workspace,
+        whether the source is a directory).
+    """
+    template_files_dir = repo_root / "template_repo_files"
+    sources = [
+        (template_files_dir / name, name, False)
+        for name in _TEMPLATE_BASE_FILES
+        if (template_files_dir / name).exists()
+    ]
+    sources += [
+        (template_files_dir / name, name, True)
+        for name in _TEMPLATE_BASE_DIRS
+        if (template_files_dir / name).exists()
+    ]
+    # notebook_grader.py goes to tests/
+    grader = repo_root / "tests" / "notebook_grader.py"
+    if grader.exists():
+        sources.append((grader, "tests/notebook_grader.py", False))
+    return tuple(sources)
+
 
 class TemplatePackager:
     """Package templates for GitHub."""
@@ -47,50 +83,62 @@ class TemplatePackager:
             files: Dictionary mapping exercise ID to file paths.
             include_solutions: Whether to include solution notebooks.
         """
-        for exercise_id, file_dict in files.items():
-            # Copy student notebook
-            if file_dict.get("notebook"):
-                dest = workspace / "notebooks" / f"{exercise_id}.ipynb"
-                safe_copy_file(file_dict["notebook"], dest)
-            
-            # Copy solution notebook if requested
-            if include_solutions and "solution" in file_dict and file_dict["solution"]:
-                dest = workspace / "notebooks" / "solutions" / f"{exercise_id}.ipynb"
-                safe_copy_file(file_dict["solution"], dest)
-            
-            # Copy test file
-            if file_dict.get("test"):
-                dest = workspace / "tests" / f"test_{exercise_id}.py"
-                safe_copy_file(file_dict["test"], dest)
-            
-            # Copy metadata if it exists
-            if file_dict.get("metadata"):
-                # Preserve structure: exercises/construct/type/exercise_id/README.md
-                # But for template, we can simplify to exercises/exercise_id/README.md
-                dest = workspace / "exercises" / exercise_id / "README.md"
-                safe_copy_file(file_dict["metadata"], dest)
-
-    def _copy_single_file(self, filename: str, workspace: Path) -> None:
-        """Copy a single template file if it exists.
+        copies = [
+            (src, dest)
+            for exercise_id, file_dict in files.items()
+            for src, dest in self._exercise_copies(
+                workspace, exercise_id, file_dict, include_solutions
+            )
+        ]
+        if len(copies) <= 1:
+            for src, dest in copies:
+                safe_copy_file(src, dest)
+            return
         
-        Args:
-            filename: Name of the file to copy.
-            workspace: Destination workspace directory.
-        """
-        src = self.template_files_dir / filename
-        if src.exists():
-            safe_copy_file(src, workspace / filename)
+        # Exercises are independent, so copy them concurrently; list() re-raises
+        # the first copy error
+        with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(copies))) as pool:
+            list(pool.map(lambda pair: safe_copy_file(*pair), copies))
 
-    def _copy_directory(self, dirname: str, workspace: Path) -> None:
-        """Copy a template directory if it exists.
+    def _exercise_copies(
+        self,
+        workspace: Path,
+        exercise_id: str,
+        file_dict: dict[str, Path],
+        include_solutions: bool,
+    ) -> list[tuple[Path, Path]]:
+        """List the (source, destination) copies for one exercise.
         
         Args:
-            dirname: Name of the directory to copy.
-            workspace: Destination workspace directory.
+            workspace: Workspace directory.
+            exercise_id: Exercise ID.
+            file_dict: Collected file paths for the exercise.
+            include_solutions: Whether to include solution notebooks.
+            
+        Returns:
+            List of (source, destination) path pairs.
         """
-        src = self.template_files_dir / dirname
-        if src.exists():
-            safe_copy_directory(src, workspace / dirname)
+        copies: list[tuple[Path, Path]] = []
+        # Copy student notebook
+        if file_dict.get("notebook"):
+            copies.append((file_dict["notebook"], workspace / "notebooks" / f"{exercise_id}.ipynb"))
+        
+        # Copy solution notebook if requested
+        if include_solutions and "solution" in file_dict and file_dict["solution"]:
+            copies.append(
+                (file_dict["solution"], workspace / "notebooks" / "solutions" / f"{exercise_id}.ipynb")
+            )
+        
+        # Copy test file
+        if file_dict.get("test"):
+            copies.append((file_dict["test"], workspace / "tests" / f"test_{exercise_id}.py"))
+        
+        # Copy metadata if it exists
+        if file_dict.get("metadata"):
+            # Preserve structure: exercises/construct/type/exercise_id/README.md
+            # But for template, we can simplify to exercises/exercise_id/README.md
+            copies.append((file_dict["metadata"], workspace / "exercises" / exercise_id / "README.md"))
+        return copies
 
     def copy_template_base_files(self, workspace: Path) -> None:
         """Copy base template files.
@@ -103,21 +151,12 @@ class TemplatePackager:
                 f"Template files directory not found: {self.template_files_dir}"
             )
         
-        # Copy individual files
-        self._copy_single_file("pyproject.toml", workspace)
-        self._copy_single_file("pytest.ini", workspace)
-        self._copy_single_file(".gitignore", workspace)
-        self._copy_single_file("INSTRUCTIONS.md", workspace)
-        
-        # Copy directories
-        self._copy_directory(".vscode", workspace)
-        self._copy_directory(".github", workspace)
-        
-        # Copy notebook_grader.py to tests/
-        src = self.repo_root / "tests" / "notebook_grader.py"
-        if src.exists():
-            dest = workspace / "tests" / "notebook_grader.py"
-            safe_copy_file(src, dest)
+        # Copy template files and directories, and notebook_grader.py to tests/
+        for src, rel_dest, is_dir in _template_base_sources(self.repo_root):
+            if is_dir:
+                safe_copy_directory(src, workspace / rel_dest)
+            else:
+                safe_copy_file(src, workspace / rel_dest)
         
         # Create tests/__init__.py
         (workspace / "tests" / "__init__.py").touch()
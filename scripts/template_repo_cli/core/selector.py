@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import bisect
 import fnmatch
+import functools
+import itertools
+import re
 from pathlib import Path
 
 from scripts.template_repo_cli.utils.validation import (
@@ -12,6 +16,49 @@ from scripts.template_repo_cli.utils.validation import (
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a notebook glob pattern once.
+    
+    Args:
+        pattern: Glob pattern such as ``ex00*``.
+        
+    Returns:
+        Compiled regex matching the pattern case-sensitively.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+# First glob metacharacter; everything before it must match literally
+_GLOB_META = re.compile(r"[*?\[]")
+
+
+def scan_notebooks(notebooks_dir: Path) -> tuple[str, ...]:
+    """Return the exercise notebook IDs in a directory.
+    
+    The scan is cached per directory and modification time, so repeated
+    lookups share one walk while added or removed notebooks are still seen.
+    
+    Args:
+        notebooks_dir: Directory holding ``ex*.ipynb`` notebooks.
+        
+    Returns:
+        Sorted notebook IDs (filenames without extension); empty if the
+        directory does not exist.
+    """
+    try:
+        mtime_ns = notebooks_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _scan_notebooks_cached(notebooks_dir, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_notebooks_cached(notebooks_dir: Path, mtime_ns: int) -> tuple[str, ...]:
+    # mtime_ns is part of the cache key only
+    return tuple(sorted(nb_file.stem for nb_file in notebooks_dir.glob("ex*.ipynb")))
+
+
 class ExerciseSelector:
     """Select exercises based on various criteria."""
 
@@ -31,12 +78,7 @@ class ExerciseSelector:
         Returns:
             List of notebook IDs (without .ipynb extension).
         """
-        notebooks = []
-        if self.notebooks_dir.exists():
-            for nb_file in self.notebooks_dir.glob("ex*.ipynb"):
-                # Extract notebook ID (filename without extension)
-                notebooks.append(nb_file.stem)
-        return notebooks
+        return list(scan_notebooks(self.notebooks_dir))
 
     def _validate_constructs(self, constructs: list[str]) -> None:
         """Validate construct names.
@@ -70,48 +112,31 @@ class ExerciseSelector:
             if not validate_type_name(type_name):
                 raise ValueError(f"Invalid type: {type_name}")
 
-    def _find_exercises_in_construct(self, construct: str) -> list[str]:
-        """Find all exercises in a construct.
-        
-        Args:
-            construct: Construct name.
-            
-        Returns:
-            List of exercise IDs found.
-        """
-        exercises = []
-        construct_dir = self.exercises_dir / construct
+    @functools.cached_property
+    def _index(self) -> dict[tuple[str, str], frozenset[str]]:
+        """Map each (construct, type) pair to its exercise IDs.
         
-        if construct_dir.exists():
-            # Find all exercise directories under this construct
-            for type_dir in construct_dir.iterdir():
-                if type_dir.is_dir():
-                    for ex_dir in type_dir.iterdir():
-                        if ex_dir.is_dir() and ex_dir.name.startswith("ex"):
-                            exercises.append(ex_dir.name)
-        
-        return exercises
-
-    def _find_exercises_by_type(self, type_name: str) -> list[str]:
-        """Find all exercises of a specific type.
+        Built from one walk of the exercises directory on first use.
         
-        Args:
-            type_name: Exercise type.
-            
         Returns:
-            List of exercise IDs found.
+            Exercise IDs keyed by construct and type directory names.
         """
-        exercises = []
+        index: dict[tuple[str, str], frozenset[str]] = {}
+        if not self.exercises_dir.is_dir():
+            return index
         
         for construct_dir in self.exercises_dir.iterdir():
-            if construct_dir.is_dir():
-                type_dir = construct_dir / type_name
-                if type_dir.exists() and type_dir.is_dir():
-                    for ex_dir in type_dir.iterdir():
-                        if ex_dir.is_dir() and ex_dir.name.startswith("ex"):
-                            exercises.append(ex_dir.name)
+            if not construct_dir.is_dir():
+                continue
+            for type_dir in construct_dir.iterdir():
+                if type_dir.is_dir():
+                    index[(construct_dir.name, type_dir.name)] = frozenset(
+                        ex_dir.name
+                        for ex_dir in type_dir.iterdir()
+                        if ex_dir.is_dir() and ex_dir.name.startswith("ex")
+                    )
         
-        return exercises
+        return index
 
     def select_by_construct(self, constructs: list[str]) -> list[str]:
         """Select exercises by construct.
@@ -127,11 +152,13 @@ class ExerciseSelector:
         """
         self._validate_constructs(constructs)
         
-        exercises = []
-        for construct in constructs:
-            exercises.extend(self._find_exercises_in_construct(construct))
+        wanted = set(constructs)
+        exercises: set[str] = set()
+        for (construct, _), ids in self._index.items():
+            if construct in wanted:
+                exercises |= ids
         
-        return sorted(set(exercises))
+        return sorted(exercises)
 
     def select_by_type(self, types: list[str]) -> list[str]:
         """Select exercises by type.
@@ -147,39 +174,13 @@ class ExerciseSelector:
         """
         self._validate_types(types)
         
-        exercises = []
-        for type_name in types:
-            exercises.extend(self._find_exercises_by_type(type_name))
+        wanted = set(types)
+        exercises: set[str] = set()
+        for (_, type_name), ids in self._index.items():
+            if type_name in wanted:
+                exercises |= ids
         
-        return sorted(set(exercises))
-
-    def _find_exercises_in_type_dir(
-        self, construct: str, type_name: str
-    ) -> list[str]:
-        """Find exercises in a specific construct/type directory.
-        
-        Args:
-            construct: Construct name.
-            type_name: Exercise type name.
-            
-        Returns:
-            List of exercise IDs found.
-        """
-        exercises = []
-        construct_dir = self.exercises_dir / construct
-        
-        if not construct_dir.exists():
-            return exercises
-        
-        type_dir = construct_dir / type_name
-        if not type_dir.exists():
-            return exercises
-        
-        for ex_dir in type_dir.iterdir():
-            if ex_dir.is_dir() and ex_dir.name.startswith("ex"):
-                exercises.append(ex_dir.name)
-        
-        return exercises
+        return sorted(exercises)
 
     def select_by_construct_and_type(
         self, constructs: list[str], types: list[str]
@@ -196,12 +197,12 @@ class ExerciseSelector:
         self._validate_constructs(constructs)
         self._validate_types(types)
         
-        exercises = []
+        exercises: set[str] = set()
         for construct in constructs:
             for type_name in types:
-                exercises.extend(self._find_exercises_in_type_dir(construct, type_name))
+                exercises |= self._index.get((construct, type_name), frozenset())
         
-        return sorted(set(exercises))
+        return sorted(exercises)
 
     def select_by_notebooks(self, notebooks: list[str]) -> list[str]:
         """Select specific notebooks.
@@ -243,8 +244,15 @@ class ExerciseSelector:
         if not validate_notebook_pattern(pattern):
             raise ValueError(f"Invalid pattern: {pattern}")
         
-        # Get all notebooks and filter by pattern
-        all_notebooks = self.get_all_notebooks()
-        matching = [nb for nb in all_notebooks if fnmatch.fnmatch(nb, pattern)]
-        
-        return sorted(matching)
+        # Notebook IDs are sorted, so only those sharing the pattern's literal
+        # prefix need to be matched against it
+        all_notebooks = scan_notebooks(self.notebooks_dir)
+        meta = _GLOB_META.search(pattern)
+        prefix = pattern[: meta.start()] if meta else pattern
+        start = bisect.bisect_left(all_notebooks, prefix)
+        candidates = itertools.takewhile(
+            lambda nb: nb.startswith(prefix), itertools.islice(all_notebooks, start, None)
+        )
+        match = _compile_pattern(pattern).match
+        
+        return [nb for nb in candidates if match(nb)]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 
 # Valid construct names based on CLI_PLAN.md
-VALID_CONSTRUCTS = {
+VALID_CONSTRUCTS = frozenset({
     "sequence",
     "selection",
     "iteration",
@@ -17,10 +17,15 @@ VALID_CONSTRUCTS = {
     "exceptions",
     "libraries",
     "oop",
-}
+})
 
 # Valid exercise types based on CLI_PLAN.md
-VALID_TYPES = {"debug", "modify", "make"}
+VALID_TYPES = frozenset({"debug", "modify", "make"})
+
+# Repository name convention: lowercase alphanumeric, hyphens, and underscores
+_REPO_NAME_RE = re.compile(r"[a-z0-9_-]+")
+_INVALID_REPO_CHARS_RE = re.compile(r"[^a-z0-9_-]+")
+_HYPHEN_RUN_RE = re.compile(r"-{2,}")
 
 
 def validate_construct_name(construct: str) -> bool:
@@ -69,8 +74,7 @@ def validate_repo_name(repo_name: str) -> bool:
         return False
     # Our convention: lowercase alphanumeric, hyphens, and underscores
     # (stricter than GitHub's actual repository name rules).
-    pattern = r"^[a-z0-9_-]+$"
-    return bool(re.match(pattern, repo_name))
+    return _REPO_NAME_RE.fullmatch(repo_name) is not None
 
 
 def sanitize_repo_name(repo_name: str) -> str:
@@ -86,22 +90,11 @@ def sanitize_repo_name(repo_name: str) -> str:
     Returns:
         Sanitized repository name following our lowercase convention.
     """
-    # Convert to lowercase
-    name = repo_name.lower()
-    
-    # Replace spaces with hyphens
-    name = name.replace(" ", "-")
-    
-    # Remove all characters except alphanumeric, hyphens, and underscores
-    name = re.sub(r"[^a-z0-9_-]", "", name)
-    
-    # Collapse multiple hyphens into single hyphen
-    name = re.sub(r"-+", "-", name)
-    
-    # Remove leading and trailing hyphens
-    name = name.strip("-")
+    # Lowercase, turn spaces into hyphens, then drop any other invalid characters
+    name = _INVALID_REPO_CHARS_RE.sub("", repo_name.lower().replace(" ", "-"))
     
-    return name
+    # Collapse multiple hyphens, then remove leading and trailing hyphens
+    return _HYPHEN_RUN_RE.sub("-", name).strip("-")
 
 
 def validate_notebook_pattern(pattern: str) -> bool:
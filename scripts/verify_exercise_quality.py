@@ -10,16 +10,29 @@ agent by performing fast, objective checks:
 - Construct teaching order updated (exercises/<construct>/OrderOfTeaching.md)
 
 It is not a replacement for reading the exercise prompts.
+
+If the optional ``ijson`` package is installed, notebook cells are streamed
+one at a time instead of loading the whole notebook JSON into memory.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # optional: fall back to the stdlib loader
+    ijson = None
+
 CONSTRUCT_ORDER: list[str] = [
     "sequence",
     "selection",
@@ -34,6 +47,8 @@ CONSTRUCT_ORDER: list[str] = [
     "oop",
 ]
 
+_CONSTRUCT_INDEX: dict[str, int] = {c: i for i, c in enumerate(CONSTRUCT_ORDER)}
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -42,6 +57,10 @@ class Finding:
     path: Path | None = None
 
 
+class _NoCellsError(Exception):
+    """Raised while iterating a notebook that has no top-level 'cells' list."""
+
+
 def _load_notebook(path: Path) -> dict:
     try:
         return json.loads(path.read_text(encoding="utf-8"))
@@ -51,8 +70,45 @@ def _load_notebook(path: Path) -> dict:
         raise SystemExit(f"Invalid JSON in notebook: {path}: {exc}") from exc
 
 
-def _cell_tags(cell: dict) -> set[str]:
-    metadata = cell.get("metadata") or {}
+def _track_cells_array(events: Iterable[tuple], seen: list[bool]) -> Iterator[tuple]:
+    for prefix, event, value in events:
+        if prefix == "cells" and event == "start_array":
+            seen.append(True)
+        yield prefix, event, value
+
+
+def _stream_cells(path: Path) -> Iterator[object]:
+    seen_cells_list: list[bool] = []
+    try:
+        with path.open("rb") as fp:
+            events = _track_cells_array(ijson.parse(fp, use_float=True), seen_cells_list)
+            yield from ijson.items(events, "cells.item")
+    except FileNotFoundError as exc:
+        raise SystemExit(f"Notebook not found: {path}") from exc
+    except ijson.JSONError as exc:
+        raise SystemExit(f"Invalid JSON in notebook: {path}: {exc}") from exc
+
+    if not seen_cells_list:
+        raise _NoCellsError
+
+
+def _iter_cells(path: Path) -> Iterator[object]:
+    """Yield the notebook's cells one at a time.
+
+    Streams with ijson when it is installed; otherwise uses `_load_notebook`.
+    Raises `_NoCellsError` (during iteration) if there is no 'cells' list.
+    """
+    if ijson is not None:
+        yield from _stream_cells(path)
+        return
+
+    cells = _load_notebook(path).get("cells")
+    if not isinstance(cells, list):
+        raise _NoCellsError
+    yield from cells
+
+
+def _cell_tags(metadata: dict) -> set[str]:
     tags = metadata.get("tags") or []
     if isinstance(tags, str):
         return {tags}
@@ -64,12 +120,22 @@ def _cell_tags(cell: dict) -> set[str]:
 def _cell_source_text(cell: dict) -> str:
     source = cell.get("source", "")
     if isinstance(source, list):
-        return "\n".join(str(x) for x in source)
+        try:
+            # nbformat guarantees a list of str, so this is the common case.
+            return "\n".join(source)
+        except TypeError:
+            return "\n".join(map(str, source))
     if isinstance(source, str):
         return source
     return ""
 
 
+def _fast_source(cell: dict) -> str:
+    # Trusts the nbformat invariants: 'source' is a str or a list of str.
+    source = cell["source"]
+    return source if type(source) is str else "\n".join(source)
+
+
 _EXERCISE_TAG_RE = re.compile(r"^exercise(?P<n>\d+)$")
 _EXPLANATION_TAG_RE = re.compile(r"^explanation(?P<n>\d+)$")
 
@@ -165,8 +231,7 @@ def _check_order_of_teaching(ex_dir: Path, *, repo_root: Path, notebook_name: st
     return findings
 
 
-def _check_cell_language(cell_index: int, cell: dict, nb_path: Path) -> list[Finding]:
-    metadata = cell.get("metadata") or {}
+def _check_cell_language(cell_index: int, metadata: dict, nb_path: Path) -> list[Finding]:
     lang = metadata.get("language")
     if lang in {"python", "markdown"}:
         return []
@@ -277,13 +342,8 @@ def _check_tag_continuity(
     return findings
 
 
-def _check_notebook_structure(nb_path: Path, nb: dict, *, expect_debug: bool) -> list[Finding]:
+def _scan_cells(nb_path: Path, cells: Iterable[object]) -> tuple[set[str], set[str], list[Finding]]:
     findings: list[Finding] = []
-
-    cells = nb.get("cells")
-    if not isinstance(cells, list):
-        return [Finding("ERROR", "Notebook has no 'cells' list", path=nb_path)]
-
     found_exercise_tags: set[str] = set()
     found_explanation_tags: set[str] = set()
 
@@ -292,10 +352,16 @@ def _check_notebook_structure(nb_path: Path, nb: dict, *, expect_debug: bool) ->
             findings.append(Finding("ERROR", f"Cell {idx} is not an object", path=nb_path))
             continue
 
-        findings.extend(_check_cell_language(idx, cell, nb_path))
+        # Fetch metadata once per cell and hand it to the helpers.
+        metadata = cell.get("metadata") or {}
+        findings.extend(_check_cell_language(idx, metadata, nb_path))
+
+        tags = _cell_tags(metadata)
+        if not tags:
+            # Untagged cells cannot contribute exercise/explanation tags.
+            continue
 
         cell_type = cell.get("cell_type")
-        tags = _cell_tags(cell)
         exercise_tags, explanation_tags, tag_findings = _collect_tag_findings(
             cell_type=cell_type,
             tags=tags,
@@ -306,6 +372,17 @@ def _check_notebook_structure(nb_path: Path, nb: dict, *, expect_debug: bool) ->
         found_explanation_tags.update(explanation_tags)
         findings.extend(tag_findings)
 
+    return found_exercise_tags, found_explanation_tags, findings
+
+
+def _check_notebook_structure(
+    nb_path: Path, cells: Iterable[object], *, expect_debug: bool
+) -> list[Finding]:
+    try:
+        found_exercise_tags, found_explanation_tags, findings = _scan_cells(nb_path, cells)
+    except _NoCellsError:
+        return [Finding("ERROR", "Notebook has no 'cells' list", path=nb_path)]
+
     findings.extend(
         _check_tag_continuity(
             nb_path=nb_path,
@@ -358,10 +435,7 @@ def _progression_rules() -> dict[str, list[re.Pattern[str]]]:
 
 
 def _index_of_construct(construct: str) -> int:
-    try:
-        return CONSTRUCT_ORDER.index(construct)
-    except ValueError:
-        return -1
+    return _CONSTRUCT_INDEX.get(construct, -1)
 
 
 def _scan_for_progression_violations(
@@ -369,8 +443,17 @@ def _scan_for_progression_violations(
     text: str,
     allowed_construct: str,
     path: Path,
+    skip: set[str] | None = None,
 ) -> list[Finding]:
+    """Warn about constructs used before they are taught.
+
+    Constructs in `skip` are not searched; every construct reported here is
+    added to it, so passing the same set for the solution notebook avoids
+    re-reporting what the student notebook already flagged.
+    """
     findings: list[Finding] = []
+    if skip is None:
+        skip = set()
 
     rules = _progression_rules()
     allowed_idx = _index_of_construct(allowed_construct)
@@ -387,108 +470,112 @@ def _scan_for_progression_violations(
     disallowed = CONSTRUCT_ORDER[allowed_idx + 1 :]
 
     for construct in disallowed:
-        for pat in rules.get(construct, []):
-            # Special-case: allow a single top-level `def solve()` wrapper (and returns inside it)
-            if construct == "functions":
-                func_defs = list(re.finditer(r"^\s*def\s+([A-Za-z_]\w*)\s*\(", text, re.M))
-                # If there are any named functions other than `solve`, report as before
-                other_funcs = [m for m in func_defs if m.group(1) != "solve"]
-                if other_funcs:
-                    findings.append(
-                        Finding(
-                            "WARN",
-                            f"Possible progression violation: found {construct} pattern {pat.pattern!r}",
-                            path=path,
-                        )
-                    )
-                    break
-                # If pattern is the def pattern and only `solve` exists, skip warning
-                if pat.pattern == r"^\s*def\s+":
-                    if func_defs:
-                        continue
-                # If pattern is the return pattern, ensure all returns are inside solve()
-                if pat.pattern == r"\breturn\b":
-                    if func_defs:
-                        # Build solve() regions and ensure every 'return' is inside some solve() region
-                        regions: list[tuple[int, int]] = []
-                        for idx, m in enumerate(func_defs):
-                            s = m.start()
-                            e = (
-                                func_defs[idx + 1].start()
-                                if idx + 1 < len(func_defs)
-                                else len(text)
-                            )
-                            regions.append((s, e))
-                        return_positions = [m.start() for m in re.finditer(r"\breturn\b", text)]
-                        if return_positions and all(
-                            any(s <= pos < e for s, e in regions) for pos in return_positions
-                        ):
-                            continue
-                # otherwise fallthrough to regular warning
-
-            if pat.search(text):
-                findings.append(
-                    Finding(
-                        "WARN",
-                        f"Possible progression violation: found {construct} pattern {pat.pattern!r}",
-                        path=path,
-                    )
+        if construct in skip:
+            continue
+        pat = _first_violation(construct, rules.get(construct, []), text)
+        if pat is not None:
+            findings.append(
+                Finding(
+                    "WARN",
+                    f"Possible progression violation: found {construct} pattern {pat.pattern!r}",
+                    path=path,
                 )
-                break
+            )
+            skip.add(construct)
 
     return findings
 
 
-def _collect_code_cell_text(nb: dict) -> str:
-    cells = nb.get("cells")
-    if not isinstance(cells, list):
-        return ""
-    return "\n\n".join(
-        _cell_source_text(c) for c in cells if isinstance(c, dict) and c.get("cell_type") == "code"
+def _first_violation(
+    construct: str, patterns: list[re.Pattern[str]], text: str
+) -> re.Pattern[str] | None:
+    """Return the first of `construct`'s patterns that flags `text`, if any."""
+    if construct == "functions":
+        return _first_functions_violation(patterns, text)
+    return next((pat for pat in patterns if pat.search(text)), None)
+
+
+def _first_functions_violation(patterns: list[re.Pattern[str]], text: str) -> re.Pattern[str] | None:
+    # Special-case: allow a single top-level `def solve()` wrapper (and returns inside it)
+    func_defs = list(re.finditer(r"^\s*def\s+([A-Za-z_]\w*)\s*\(", text, re.M))
+    # If there are any named functions other than `solve`, report as before
+    if any(m.group(1) != "solve" for m in func_defs):
+        return patterns[0] if patterns else None
+    return next(
+        (pat for pat in patterns if not _allowed_in_solve(pat, func_defs, text) and pat.search(text)),
+        None,
+    )
+
+
+def _allowed_in_solve(pat: re.Pattern[str], func_defs: list[re.Match[str]], text: str) -> bool:
+    if not func_defs:
+        return False
+    # The def pattern is fine when only `solve` is defined
+    if pat.pattern == r"^\s*def\s+":
+        return True
+    # The return pattern is fine when every 'return' is inside solve()
+    return pat.pattern == r"\breturn\b" and _returns_inside(func_defs, text)
+
+
+def _returns_inside(func_defs: list[re.Match[str]], text: str) -> bool:
+    # Build solve() regions and ensure every 'return' is inside some solve() region
+    regions: list[tuple[int, int]] = []
+    for idx, m in enumerate(func_defs):
+        s = m.start()
+        e = func_defs[idx + 1].start() if idx + 1 < len(func_defs) else len(text)
+        regions.append((s, e))
+    return_positions = [m.start() for m in re.finditer(r"\breturn\b", text)]
+    return bool(return_positions) and all(
+        any(s <= pos < e for s, e in regions) for pos in return_positions
     )
 
 
+def _iter_code_sources(cells: Iterable[object]) -> Iterator[str]:
+    for c in cells:
+        try:
+            if c["cell_type"] == "code":
+                yield _fast_source(c)
+        except (KeyError, TypeError):
+            # Malformed cell (already reported by the structure check):
+            # fall back to the defensive accessors.
+            if isinstance(c, dict) and c.get("cell_type") == "code":
+                yield _cell_source_text(c)
+
+
+def _tee_code_sources(cells: Iterable[object], sink: list[str]) -> Iterator[object]:
+    # Pass cells through unchanged, appending each code cell's source to sink.
+    for cell in cells:
+        sink.extend(_iter_code_sources((cell,)))
+        yield cell
+
+
+def _scan_notebook(nb_path: Path, *, expect_debug: bool) -> tuple[list[Finding], str]:
+    """Check a notebook's structure and collect its code-cell text in one parse."""
+    code_sources: list[str] = []
+    cells = _tee_code_sources(_iter_cells(nb_path), code_sources)
+    findings = _check_notebook_structure(nb_path, cells, expect_debug=expect_debug)
+    return findings, "\n\n".join(code_sources)
+
+
 def _print_findings(findings: list[Finding]) -> None:
     for f in findings:
         loc = f" ({f.path})" if f.path else ""
         print(f"{f.severity}: {f.message}{loc}")
 
 
-def main(argv: list[str] | None = None) -> int:  # noqa: C901
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument(
-        "notebook",
-        type=Path,
-        help="Path to the student notebook under notebooks/",
-    )
-    parser.add_argument(
-        "--repo-root",
-        type=Path,
-        default=Path(__file__).resolve().parents[1],
-        help="Repository root (default: auto-detected)",
-    )
-    parser.add_argument(
-        "--construct",
-        choices=CONSTRUCT_ORDER,
-        default=None,
-        help="Construct to validate progression against (default: inferred from exercises/)",
-    )
-    parser.add_argument(
-        "--type",
-        choices=["debug", "modify", "make"],
-        default=None,
-        help="Exercise type (default: inferred from exercises/)",
-    )
-
-    args = parser.parse_args(argv)
-
-    nb_path = args.notebook
-    repo_root = args.repo_root
+def verify_one(  # noqa: C901
+    nb_path: Path,
+    repo_root: Path,
+    construct: str | None = None,
+    ex_type: str | None = None,
+) -> list[Finding]:
+    """Run every check against one student notebook and return the findings.
 
+    `construct` and `ex_type` override the values inferred from exercises/.
+    """
     slug = _infer_exercise_slug_from_notebook(nb_path)
     if slug is None:
-        print("ERROR: Notebook path must end with .ipynb")
-        return 2
+        return [Finding("ERROR", "Notebook path must end with .ipynb", path=nb_path)]
 
     ex_dir = _find_exercise_dir(slug, repo_root)
     inferred_construct: str | None = None
@@ -496,8 +583,8 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901
     if ex_dir is not None:
         inferred_construct, inferred_type = _infer_construct_and_type(ex_dir)
 
-    construct = args.construct or inferred_construct
-    ex_type = args.type or inferred_type
+    construct = construct or inferred_construct
+    ex_type = ex_type or inferred_type
 
     findings: list[Finding] = []
 
@@ -516,18 +603,19 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901
             _check_order_of_teaching(ex_dir, repo_root=repo_root, notebook_name=nb_path.name)
         )
 
-    # Notebook structure (student)
-    nb_student = _load_notebook(nb_path)
+    # Notebook structure (student); the same pass collects code for the progression scan
     expect_debug = ex_type == "debug"
-    findings.extend(_check_notebook_structure(nb_path, nb_student, expect_debug=expect_debug))
+    structure_findings, student_text = _scan_notebook(nb_path, expect_debug=expect_debug)
+    findings.extend(structure_findings)
 
     # Notebook structure (solutions mirror) if present
     nb_solution_path = repo_root / "notebooks" / "solutions" / nb_path.name
+    solution_text: str | None = None
     if nb_solution_path.exists():
-        nb_solution = _load_notebook(nb_solution_path)
-        findings.extend(
-            _check_notebook_structure(nb_solution_path, nb_solution, expect_debug=expect_debug)
+        structure_findings, solution_text = _scan_notebook(
+            nb_solution_path, expect_debug=expect_debug
         )
+        findings.extend(structure_findings)
     else:
         findings.append(
             Finding("WARN", "Solution mirror notebook not found", path=nb_solution_path)
@@ -543,22 +631,143 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901
             )
         )
     else:
-        student_text = _collect_code_cell_text(nb_student)
+        already_reported: set[str] = set()
         findings.extend(
             _scan_for_progression_violations(
-                text=student_text, allowed_construct=construct, path=nb_path
+                text=student_text,
+                allowed_construct=construct,
+                path=nb_path,
+                skip=already_reported,
             )
         )
 
-        if nb_solution_path.exists():
-            solution_text = _collect_code_cell_text(_load_notebook(nb_solution_path))
+        if solution_text is not None:
             findings.extend(
                 _scan_for_progression_violations(
                     text=solution_text,
                     allowed_construct=construct,
                     path=nb_solution_path,
+                    skip=already_reported,
+                )
+            )
+
+    return findings
+
+
+# Below this many notebooks, a process pool costs more to start than it saves.
+_PARALLEL_BATCH_THRESHOLD = 8
+
+
+def verify_many(
+    paths: list[Path],
+    repo_root: Path,
+    construct: str | None = None,
+    ex_type: str | None = None,
+) -> list[Finding]:
+    """Verify a batch of notebooks in one process, fanning out to a pool when large."""
+    if len(paths) < _PARALLEL_BATCH_THRESHOLD:
+        results = [verify_one(p, repo_root, construct, ex_type) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(
+                pool.map(
+                    verify_one,
+                    paths,
+                    repeat(repo_root),
+                    repeat(construct),
+                    repeat(ex_type),
                 )
             )
+    return [f for findings in results for f in findings]
+
+
+def _read_batch_paths(args: argparse.Namespace) -> list[Path]:
+    if args.notebook:
+        return list(args.notebook)
+    return [Path(line.strip()) for line in sys.stdin if line.strip()]
+
+
+def _default_repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _fast_parse_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the common `verify path.ipynb` form without building a parser.
+
+    Returns None for anything else (options, --help, several paths) so the
+    caller falls back to argparse and keeps its behaviour and messages.
+    """
+    if len(argv) != 1 or argv[0].startswith("-"):
+        return None
+    return argparse.Namespace(
+        notebook=[Path(argv[0])],
+        repo_root=_default_repo_root(),
+        construct=None,
+        type=None,
+        batch=False,
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "notebook",
+        type=Path,
+        nargs="*",
+        help="Path to the student notebook under notebooks/ (several with --batch)",
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=_default_repo_root(),
+        help="Repository root (default: auto-detected)",
+    )
+    parser.add_argument(
+        "--construct",
+        choices=CONSTRUCT_ORDER,
+        default=None,
+        help="Construct to validate progression against (default: inferred from exercises/)",
+    )
+    parser.add_argument(
+        "--type",
+        choices=["debug", "modify", "make"],
+        default=None,
+        help="Exercise type (default: inferred from exercises/)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Verify every notebook given as an argument (or one path per line on stdin)",
+    )
+
+    return parser
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    args = _fast_parse_args(argv)
+    if args is not None:
+        return args
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if not args.batch and len(args.notebook) != 1:
+        parser.error("exactly one notebook is required (use --batch for several)")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_args(argv)
+
+    if args.batch:
+        findings = verify_many(_read_batch_paths(args), args.repo_root, args.construct, args.type)
+    else:
+        nb_path = args.notebook[0]
+        if _infer_exercise_slug_from_notebook(nb_path) is None:
+            print("ERROR: Notebook path must end with .ipynb")
+            return 2
+        findings = verify_one(nb_path, args.repo_root, args.construct, args.type)
 
     # Report
     _print_findings(findings)
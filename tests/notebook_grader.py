@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 from pathlib import Path
+from types import CodeType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+# Set to any non-empty value to bypass the extraction cache, e.g. for tests
+# that rewrite a notebook in place faster than the filesystem mtime resolution.
+NO_CACHE_ENV_VAR = "PYTUTOR_NO_NOTEBOOK_CACHE"
+
 
 class NotebookGradingError(RuntimeError):
     pass
@@ -43,12 +54,46 @@ def _read_notebook(notebook_path: str | Path) -> dict[str, Any]:
     if not path.exists():
         raise NotebookGradingError(f"Notebook not found: {path}")
 
+    data = path.read_bytes()
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as exc:  # both parsers' decode errors subclass ValueError
         raise NotebookGradingError(f"Invalid JSON in notebook: {path}") from exc
 
 
+def load_cells_by_tag(notebook_path: str | Path) -> dict[str, dict[str, Any]]:
+    """Return a notebook's cells keyed by tag, built once while the file is unchanged.
+
+    The path is resolved like `exec_tagged_code`'s. Each tag maps to the first
+    cell carrying it. The returned dict is shared between callers, so treat it
+    as read-only.
+    """
+
+    path = resolve_notebook_path(notebook_path)
+    if not path.exists():
+        raise NotebookGradingError(f"Notebook not found: {path}")
+    if os.environ.get(NO_CACHE_ENV_VAR):
+        return index_cells_by_tag(_read_notebook(path).get("cells") or [])
+    return _cells_by_tag_cached(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _cells_by_tag_cached(path: Path, mtime_ns: int) -> dict[str, dict[str, Any]]:
+    return index_cells_by_tag(_read_notebook_cached(path, mtime_ns).get("cells") or [])
+
+
+def index_cells_by_tag(cells: list) -> dict[str, dict[str, Any]]:
+    """Map each tag to the first cell in `cells` that carries it."""
+    index: dict[str, dict[str, Any]] = {}
+    for cell in cells:
+        if isinstance(cell, dict):
+            for tag in _cell_tags(cell):
+                index.setdefault(tag, cell)
+    return index
+
+
 def _cell_tags(cell: dict[str, Any]) -> set[str]:
     metadata = cell.get("metadata") or {}
     tags = metadata.get("tags") or []
@@ -79,12 +124,14 @@ def extract_tagged_code(notebook_path: str | Path, *, tag: str = "student") -> s
     We keep this pure-stdlib (no nbformat/nbclient dependency) to reduce classroom friction.
     """
 
-    nb = _read_notebook(notebook_path)
-    cells = nb.get("cells")
-    if not isinstance(cells, list):
-        raise NotebookGradingError("Notebook has no 'cells' list")
+    path = resolve_notebook_path(notebook_path)
+    if not path.exists():
+        raise NotebookGradingError(f"Notebook not found: {path}")
 
-    tagged_sources = _collect_tagged_sources(cells, tag)
+    if os.environ.get(NO_CACHE_ENV_VAR):
+        tagged_sources = _extract_tagged_sources(path, tag)
+    else:
+        tagged_sources = _extract_tagged_sources_cached(path, path.stat().st_mtime_ns, tag)
 
     if not tagged_sources:
         raise NotebookGradingError(
@@ -94,6 +141,36 @@ def extract_tagged_code(notebook_path: str | Path, *, tag: str = "student") -> s
     return "\n\n".join(tagged_sources).strip() + "\n"
 
 
+def _extract_tagged_sources(path: Path, tag: str) -> tuple[str, ...]:
+    return _sources_from_notebook(_read_notebook(path), tag)
+
+
+def _sources_from_notebook(nb: dict[str, Any], tag: str) -> tuple[str, ...]:
+    cells = nb.get("cells")
+    if not isinstance(cells, list):
+        raise NotebookGradingError("Notebook has no 'cells' list")
+
+    return tuple(_collect_tagged_sources(cells, tag))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_notebook_cached(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a notebook once for all its tags; callers must not mutate the result."""
+    return _read_notebook(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_tagged_sources_cached(path: Path, mtime_ns: int, tag: str) -> tuple[str, ...]:
+    """Cached `_extract_tagged_sources`; `mtime_ns` invalidates entries on edit."""
+    return _sources_from_notebook(_read_notebook_cached(path, mtime_ns), tag)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(code: str, filename: str) -> CodeType:
+    # Keyed on the source text itself, so an edited notebook can never hit a stale entry.
+    return compile(code, filename, "exec")
+
+
 def _collect_tagged_sources(cells: list, tag: str) -> list[str]:
     """Collect source text from code cells tagged with the given tag."""
     tagged_sources: list[str] = []
@@ -126,6 +203,5 @@ def exec_tagged_code(
         "__file__": filename,
     }
 
-    compiled = compile(code, filename, "exec")
-    exec(compiled, ns, ns)
+    exec(_compile_cached(code, filename), ns, ns)
     return ns
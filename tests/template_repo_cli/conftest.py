@@ -2,20 +2,52 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
 import tempfile
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Any
 
 import pytest
 
+from scripts.template_repo_cli.core.github import GitHubClient
+from scripts.template_repo_cli.core.selector import ExerciseSelector, scan_notebooks
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def repo_root() -> Path:
     """Get the repository root directory."""
     return Path(__file__).parent.parent.parent
 
 
+@pytest.fixture(scope="session")
+def notebook_index(repo_root: Path) -> tuple[str, ...]:
+    """Notebook IDs in the repository, scanned once per session."""
+    return scan_notebooks(repo_root / "notebooks")
+
+
+@pytest.fixture(scope="session")
+def selector(repo_root: Path) -> ExerciseSelector:
+    """Exercise selector over the repository, shared across the session."""
+    return ExerciseSelector(repo_root)
+
+
+@pytest.fixture(scope="session")
+def ex001_files(repo_root: Path) -> dict[str, dict[str, Path]]:
+    """ex001_sanity notebook, solution and test paths, built once per session.
+
+    Shared across tests, so it must only be read.
+    """
+    return {
+        "ex001_sanity": {
+            "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
+            "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
+            "test": repo_root / "tests/test_ex001_sanity.py",
+        }
+    }
+
+
 @pytest.fixture
 def sample_exercises(repo_root: Path) -> dict[str, dict[str, Path]]:
     """Sample exercise file mappings for testing."""
@@ -36,6 +68,22 @@ def sample_exercises(repo_root: Path) -> dict[str, dict[str, Path]]:
     }
 
 
+@pytest.fixture(scope="session")
+def _worker_tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Temp root private to this pytest process (xdist gives each worker its own basetemp)."""
+    return tmp_path_factory.mktemp("tempfile")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tempfile(monkeypatch: pytest.MonkeyPatch, _worker_tmp_root: Path) -> None:
+    """Point tempfile (mkdtemp, TemporaryDirectory) at the per-worker root.
+
+    Workers then never create entries in the same shared system temp dir.
+    tempfile caches its directory, so setting TMPDIR would not be enough.
+    """
+    monkeypatch.setattr(tempfile, "tempdir", str(_worker_tmp_root))
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for testing."""
@@ -43,31 +91,109 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def shared_empty_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty directory shared by tests that only read from or pass a path."""
+    return tmp_path_factory.mktemp("shared_empty")
+
+
+# check_scopes result for an authenticated user with the repo scope
+SCOPES_OK: dict[str, Any] = {
+    "authenticated": True,
+    "has_scopes": True,
+    "scopes": ["repo"],
+    "missing_scopes": [],
+}
+
+
+@pytest.fixture
+def gh_ok(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Make GitHubClient's gh prerequisite checks pass without running gh.
+
+    Returns the monkeypatch so tests can override a single check.
+    """
+    monkeypatch.setattr(GitHubClient, "check_gh_installed", lambda self: True)
+    monkeypatch.setattr(GitHubClient, "check_authentication", lambda self: True)
+    monkeypatch.setattr(GitHubClient, "check_scopes", lambda self, required_scopes=None: SCOPES_OK)
+    return monkeypatch
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Remove the GitHub token variables the CLI inspects.
+
+    Only those keys are touched, so monkeypatch restores just them afterwards.
+    Returns the monkeypatch so tests can ``setenv`` a token.
+    """
+    for key in ("GITHUB_TOKEN", "GH_TOKEN"):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="module")
+def module_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One temporary root shared by every test in a module."""
+    return tmp_path_factory.mktemp("mod")
+
+
+@pytest.fixture(scope="session")
+def _fs_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the shared filesystem scaffold once per session."""
+    root = tmp_path_factory.mktemp("fs_template")
+    source = root / "source_dir"
+    (source / "subdir").mkdir(parents=True)
+    (source / "file1.txt").write_text("content1")
+    (source / "file2.txt").write_text("content2")
+    (source / "subdir/file2.txt").write_text("content2")
+    return root
+
+
+@pytest.fixture
+def fs_scenario(_fs_template: Path, tmp_path: Path) -> Path:
+    """Fresh copy of the scaffold: ``source_dir/{file1.txt,file2.txt,subdir/file2.txt}``."""
+    return Path(shutil.copytree(_fs_template, tmp_path / "scenario", copy_function=shutil.copy2))
+
+
 @pytest.fixture
-def mock_gh_success() -> MagicMock:
-    """Mock successful gh CLI execution."""
-    mock = MagicMock()
-    mock.return_value = MagicMock(
-        returncode=0, stdout='{"name": "test-repo"}', stderr=""
-    )
-    return mock
+def gh_client() -> GitHubClient:
+    """Fresh GitHub client; clients cache lookups such as the login."""
+    return GitHubClient()
 
 
 @pytest.fixture
-def mock_gh_failure() -> MagicMock:
-    """Mock failed gh CLI execution."""
-    mock = MagicMock()
-    mock.return_value = MagicMock(returncode=1, stdout="", stderr="Error occurred")
-    return mock
+def gh_client_dry() -> GitHubClient:
+    """Fresh dry-run GitHub client."""
+    return GitHubClient(dry_run=True)
+
+
+class FakeShell:
+    """In-memory stand-in for ``subprocess.run`` covering gh/git commands.
+
+    Each call's argv is logged in ``calls``. The response is the one registered
+    for the longest matching argv prefix, or a successful empty result.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self._responses: dict[tuple[str, ...], Any] = {}
+        self.default = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+
+    def set_response(self, prefix: Sequence[str], response: Any) -> None:
+        """Return `response` for every command starting with `prefix`."""
+        self._responses[tuple(prefix)] = response
+
+    def run(self, argv: Sequence[str], *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(list(argv))
+        for n in range(len(argv), 0, -1):
+            response = self._responses.get(tuple(argv[:n]))
+            if response is not None:
+                return response
+        return self.default
 
 
 @pytest.fixture
-def mock_gh_auth_error() -> MagicMock:
-    """Mock gh CLI authentication error."""
-    mock = MagicMock()
-    mock.return_value = MagicMock(
-        returncode=1,
-        stdout="",
-        stderr="error: authentication required. Run 'gh auth login'",
-    )
-    return mock
+def fake_shell(monkeypatch: pytest.MonkeyPatch) -> FakeShell:
+    """Route subprocess.run through a fresh `FakeShell`."""
+    shell = FakeShell()
+    monkeypatch.setattr("subprocess.run", shell.run)
+    return shell
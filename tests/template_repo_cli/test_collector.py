@@ -56,7 +56,7 @@ class TestCollectMissingFiles:
         with pytest.raises(FileNotFoundError, match="notebook not found"):
             collector.collect_files("ex999_nonexistent")
 
-    def test_collect_missing_solution(self, repo_root: Path, temp_dir: Path) -> None:
+    def test_collect_missing_solution(self, repo_root: Path) -> None:
         """Test handling missing solution notebook."""
         # This test assumes we can create a scenario where solution is missing
         # For now, we'll test that the collector checks for solutions
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -13,14 +15,42 @@ from scripts.template_repo_cli.utils.filesystem import (
     safe_copy_file,
 )
 
+pytestmark = pytest.mark.parallel_safe
 
-class TestSafeCopyFile:
-    """Tests for safe file copying."""
 
-    def test_copy_file_successfully(self, temp_dir: Path) -> None:
+def _same_file(a: Path, b: Path) -> bool:
+    """Compare two files by size, then by streamed SHA-256 digest."""
+    if a.stat().st_size != b.stat().st_size:
+        return False
+    with a.open("rb") as fa, b.open("rb") as fb:
+        return (
+            hashlib.file_digest(fa, "sha256").digest()
+            == hashlib.file_digest(fb, "sha256").digest()
+        )
+
+
+def _record_calls(monkeypatch: pytest.MonkeyPatch, target: str) -> list[tuple[Any, ...]]:
+    """Replace `target` with a stub that records its positional/keyword args."""
+    calls: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(target, lambda *args, **kwargs: calls.append((args, kwargs)))
+    return calls
+
+
+@pytest.fixture
+def scratch(module_tmp: Path, request: pytest.FixtureRequest) -> Path:
+    """Per-test subdirectory of the module-wide temp root."""
+    directory = module_tmp / request.node.name
+    directory.mkdir()
+    return directory
+
+
+class TestSafeCopyFileSemantics:
+    """Round-trip tests for safe file copying (real I/O)."""
+
+    def test_copy_file_successfully(self, scratch: Path) -> None:
         """Test copying a file successfully."""
-        source = temp_dir / "source.txt"
-        dest = temp_dir / "dest.txt"
+        source = scratch / "source.txt"
+        dest = scratch / "dest.txt"
         source.write_text("test content")
 
         safe_copy_file(source, dest)
@@ -28,87 +58,100 @@ class TestSafeCopyFile:
         assert dest.exists()
         assert dest.read_text() == "test content"
 
-    def test_copy_file_creates_parent_directories(self, temp_dir: Path) -> None:
+    def test_copy_file_overwrites_existing(self, scratch: Path) -> None:
+        """Test copying file overwrites existing destination."""
+        source = scratch / "source.txt"
+        dest = scratch / "dest.txt"
+        source.write_text("new content")
+        dest.write_text("old content")
+
+        safe_copy_file(source, dest)
+
+        assert dest.read_text() == "new content"
+
+
+class TestSafeCopyFileDispatch:
+    """Tests that safe file copying delegates to shutil.copy2."""
+
+    def test_copy_file_creates_parent_directories(
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test copying file creates parent directories."""
-        source = temp_dir / "source.txt"
-        dest = temp_dir / "subdir/nested/dest.txt"
-        source.write_text("test content")
+        calls = _record_calls(monkeypatch, "shutil.copy2")
+        source = scratch / "source.txt"
+        dest = scratch / "subdir/nested/dest.txt"
+        source.touch()
 
         safe_copy_file(source, dest)
 
-        assert dest.exists()
-        assert dest.read_text() == "test content"
+        assert dest.parent.is_dir()
+        assert calls == [((source, dest), {})]
 
-    def test_copy_nonexistent_file_raises_error(self, temp_dir: Path) -> None:
+    def test_copy_nonexistent_file_raises_error(
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test copying nonexistent file raises FileNotFoundError."""
-        source = temp_dir / "nonexistent.txt"
-        dest = temp_dir / "dest.txt"
+        calls = _record_calls(monkeypatch, "shutil.copy2")
+        source = scratch / "nonexistent.txt"
+        dest = scratch / "dest.txt"
 
         with pytest.raises(FileNotFoundError):
             safe_copy_file(source, dest)
+        assert calls == []
 
-    def test_copy_file_overwrites_existing(self, temp_dir: Path) -> None:
-        """Test copying file overwrites existing destination."""
-        source = temp_dir / "source.txt"
-        dest = temp_dir / "dest.txt"
-        source.write_text("new content")
-        dest.write_text("old content")
 
-        safe_copy_file(source, dest)
+class TestSafeCopyDirectorySemantics:
+    """Round-trip tests for safe directory copying (real I/O)."""
 
-        assert dest.read_text() == "new content"
+    def test_copy_directory_with_subdirectories(self, fs_scenario: Path) -> None:
+        """Test copying directory with subdirectories."""
+        source = fs_scenario / "source_dir"
+        dest = fs_scenario / "dest_dir"
 
+        safe_copy_directory(source, dest)
 
-class TestSafeCopyDirectory:
-    """Tests for safe directory copying."""
+        for rel in ("file1.txt", "file2.txt", "subdir/file2.txt"):
+            assert _same_file(source / rel, dest / rel), rel
 
-    def test_copy_directory_successfully(self, temp_dir: Path) -> None:
-        """Test copying a directory successfully."""
-        source = temp_dir / "source_dir"
-        dest = temp_dir / "dest_dir"
+    def test_copy_empty_directory(self, scratch: Path) -> None:
+        """Test copying empty directory."""
+        source = scratch / "empty_dir"
+        dest = scratch / "dest_dir"
         source.mkdir()
-        (source / "file1.txt").write_text("content1")
-        (source / "file2.txt").write_text("content2")
 
         safe_copy_directory(source, dest)
 
         assert dest.exists()
-        assert (dest / "file1.txt").read_text() == "content1"
-        assert (dest / "file2.txt").read_text() == "content2"
+        assert dest.is_dir()
 
-    def test_copy_directory_with_subdirectories(self, temp_dir: Path) -> None:
-        """Test copying directory with subdirectories."""
-        source = temp_dir / "source_dir"
-        dest = temp_dir / "dest_dir"
+
+class TestSafeCopyDirectoryDispatch:
+    """Tests that safe directory copying delegates to shutil.copytree."""
+
+    def test_copy_directory_successfully(
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test copying a directory successfully."""
+        calls = _record_calls(monkeypatch, "shutil.copytree")
+        source = scratch / "source_dir"
+        dest = scratch / "dest_dir"
         source.mkdir()
-        (source / "subdir").mkdir()
-        (source / "file1.txt").write_text("content1")
-        (source / "subdir/file2.txt").write_text("content2")
 
         safe_copy_directory(source, dest)
 
-        assert (dest / "file1.txt").exists()
-        assert (dest / "subdir/file2.txt").exists()
-        assert (dest / "subdir/file2.txt").read_text() == "content2"
+        assert calls == [((source, dest), {"dirs_exist_ok": True})]
 
-    def test_copy_nonexistent_directory_raises_error(self, temp_dir: Path) -> None:
+    def test_copy_nonexistent_directory_raises_error(
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test copying nonexistent directory raises error."""
-        source = temp_dir / "nonexistent_dir"
-        dest = temp_dir / "dest_dir"
+        calls = _record_calls(monkeypatch, "shutil.copytree")
+        source = scratch / "nonexistent_dir"
+        dest = scratch / "dest_dir"
 
         with pytest.raises(FileNotFoundError):
             safe_copy_directory(source, dest)
-
-    def test_copy_empty_directory(self, temp_dir: Path) -> None:
-        """Test copying empty directory."""
-        source = temp_dir / "empty_dir"
-        dest = temp_dir / "dest_dir"
-        source.mkdir()
-
-        safe_copy_directory(source, dest)
-
-        assert dest.exists()
-        assert dest.is_dir()
+        assert calls == []
 
 
 class TestResolveNotebookPath:
@@ -122,14 +165,27 @@ class TestResolveNotebookPath:
         assert resolved == notebook_path
         assert resolved.is_absolute()
 
-    def test_resolve_notebook_path_relative(self, repo_root: Path) -> None:
+    def test_resolve_notebook_path_absolute_no_cwd_call(
+        self, repo_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test absolute paths are returned without consulting the CWD."""
+
+        def _no_cwd() -> str:
+            raise AssertionError("os.getcwd() should not be called for absolute paths")
+
+        monkeypatch.setattr("os.getcwd", _no_cwd)
+        notebook_path = repo_root / "notebooks/ex001_sanity.ipynb"
+
+        assert resolve_notebook_path(str(notebook_path)) == notebook_path
+
+    def test_resolve_notebook_path_relative(self) -> None:
         """Test resolving relative notebook path."""
         resolved = resolve_notebook_path("notebooks/ex001_sanity.ipynb")
 
         assert resolved.is_absolute()
         assert resolved.name == "ex001_sanity.ipynb"
 
-    def test_resolve_notebook_path_notebook_only(self, repo_root: Path) -> None:
+    def test_resolve_notebook_path_notebook_only(self) -> None:
         """Test resolving notebook path from name only."""
         resolved = resolve_notebook_path("ex001_sanity.ipynb")
 
@@ -148,39 +204,19 @@ class TestResolveNotebookPath:
 class TestCreateDirectoryStructure:
     """Tests for directory structure creation."""
 
-    def test_create_single_directory(self, temp_dir: Path) -> None:
-        """Test creating a single directory."""
-        target = temp_dir / "new_dir"
-
-        create_directory_structure(target)
-
-        assert target.exists()
-        assert target.is_dir()
-
-    def test_create_nested_directories(self, temp_dir: Path) -> None:
-        """Test creating nested directories."""
-        target = temp_dir / "level1/level2/level3"
+    @pytest.mark.parametrize(
+        "subpath",
+        ["new_dir", "level1/level2/level3", "parent/child", "existing_dir"],
+        ids=["single", "nested", "with_parents", "existing"],
+    )
+    def test_create_directory_structure(self, scratch: Path, subpath: str) -> None:
+        """Test creating single, nested and already-existing directories."""
+        target = scratch / subpath
+        if subpath == "existing_dir":
+            # Should not raise error when the directory already exists
+            target.mkdir()
 
         create_directory_structure(target)
 
-        assert target.exists()
         assert target.is_dir()
-
-    def test_create_existing_directory(self, temp_dir: Path) -> None:
-        """Test creating existing directory doesn't raise error."""
-        target = temp_dir / "existing_dir"
-        target.mkdir()
-
-        # Should not raise error
-        create_directory_structure(target)
-
-        assert target.exists()
-
-    def test_create_directory_with_parents(self, temp_dir: Path) -> None:
-        """Test creating directory creates parent directories."""
-        target = temp_dir / "parent/child"
-
-        create_directory_structure(target)
-
-        assert (temp_dir / "parent").exists()
-        assert target.exists()
+        assert target.parent.is_dir()
@@ -2,503 +2,668 @@
 
 from __future__ import annotations
 
+import itertools
+import os
+import re
+import shlex
+from collections.abc import Callable, Generator, Iterable
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from scripts.template_repo_cli.core import github
 from scripts.template_repo_cli.core.github import GitHubClient
+from tests.template_repo_cli.conftest import FakeShell
 
+pytestmark = pytest.mark.parallel_safe
 
-class TestBuildCreateRepoCommand:
-    """Tests for building gh repo create command."""
+# Canonical subprocess.run results, built once and shared (tests only read them).
+_OK = MagicMock(returncode=0, stdout="", stderr="")
+_OK_USER = MagicMock(returncode=0, stdout="testuser\n", stderr="")
+_OK_REPO_JSON = MagicMock(returncode=0, stdout='{"name": "test-repo"}', stderr="")
+_OK_GIT_IDENTITY = MagicMock(
+    returncode=0, stdout="user.name Test User\nuser.email test@example.com\n", stderr=""
+)
+_OK_GH_VERSION = MagicMock(returncode=0, stdout="gh version 2.0.0", stderr="")
+_OK_LOGGED_IN = MagicMock(returncode=0, stdout="Logged in to github.com", stderr="")
+_FAIL = MagicMock(returncode=1, stdout="", stderr="Error occurred")
+_FAIL_AUTH = MagicMock(returncode=1, stdout="", stderr="authentication required")
+_FAIL_RATE_LIMIT = MagicMock(returncode=1, stdout="", stderr="API rate limit exceeded")
+_FAIL_NOT_LOGGED_IN = MagicMock(returncode=1, stdout="", stderr="not logged in")
+_FAIL_INTEGRATION = MagicMock(
+    returncode=1, stdout="", stderr="GraphQL: Resource not accessible by integration (createRepository)"
+)
+_FAIL_NOTHING_TO_COMMIT = MagicMock(returncode=1, stdout="nothing to commit, working tree clean", stderr="")
 
-    def test_build_create_repo_command_basic(self, repo_root: Path) -> None:
-        """Test building basic gh repo create command."""
-        client = GitHubClient()
-        cmd = client.build_create_command("test-repo", public=True)
+# One command per line of a _run_batch script: out=$(<command> 2>&1) || ...
+_BATCH_STEP = re.compile(r"^out=\$\((.*) 2>&1\) \|\| ", re.MULTILINE)
 
-        assert "gh" in cmd
-        assert "repo" in cmd
-        assert "create" in cmd
-        assert "test-repo" in cmd
-        assert "--public" in cmd
-        # No --template flag when no template repo is provided
-        assert "--template" not in cmd
-
-    def test_build_create_with_org(self, repo_root: Path) -> None:
-        """Test building command with organization option."""
-        client = GitHubClient()
-        cmd = client.build_create_command("test-repo", org="my-org")
-
-        assert "my-org/test-repo" in " ".join(cmd)
-
-    def test_build_create_private(self, repo_root: Path) -> None:
-        """Test building command for private repository."""
-        client = GitHubClient()
-        cmd = client.build_create_command("test-repo", public=False)
-
-        assert "--private" in cmd
-
-    def test_build_create_with_description(self, repo_root: Path) -> None:
-        """Test building command with description."""
-        client = GitHubClient()
-        cmd = client.build_create_command("test-repo", description="Test description")
-
-        assert "--description" in cmd or "-d" in cmd
-
-    def test_build_create_with_template_repo_argument(self, repo_root: Path) -> None:
-        """Test passing explicit template repository argument."""
-        client = GitHubClient()
-        cmd = client.build_create_command(
-            "test-repo", template_repo="owner/template-repo"
-        )
 
-        assert "--template" in cmd
-        assert "owner/template-repo" in cmd
+class _RunStub:
+    """Lightweight stand-in for subprocess.run that records its calls.
 
-    def test_build_create_with_source_path(self, repo_root: Path) -> None:
-        """Test building command with source path for pushing files."""
-        client = GitHubClient()
-        cmd = client.build_create_command(
-            "test-repo", source_path="/tmp/workspace"
-        )
+    Results are handed out in order; exception instances are raised instead.
+    """
 
-        assert "--source" in cmd
-        assert "/tmp/workspace" in cmd
-        assert "--push" in cmd
+    def __init__(self, results: Iterable[Any]) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self._results = iter(results)
 
-    def test_build_create_without_source_path(self, repo_root: Path) -> None:
-        """Test building command without source path."""
-        client = GitHubClient()
-        cmd = client.build_create_command("test-repo")
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        result = next(self._results)
+        if isinstance(result, BaseException):
+            raise result
+        return result
 
-        assert "--source" not in cmd
-        assert "--push" not in cmd
+    def argvs(self) -> list[list[str]]:
+        """Return the argv list (first positional argument) of each call."""
+        return [args[0] for args, _ in self.calls if args]
 
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
 
-class TestExecuteGhCommand:
-    """Tests for executing gh commands."""
+    def assert_called_once(self) -> None:
+        assert self.call_count == 1, f"expected 1 call, got {self.call_count}"
 
-    @patch("subprocess.run")
-    def test_execute_gh_command_success(self, mock_run: MagicMock) -> None:
-        """Test successful execution of gh command."""
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout='{"name": "test-repo"}', stderr=""
-        )
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"expected no calls, got {self.calls}"
 
-        client = GitHubClient()
-        result = client.execute_command(["gh", "repo", "create", "test-repo"])
 
-        assert result["success"] is True
-        mock_run.assert_called_once()
+StubRun = Callable[[Any], _RunStub]
 
-    @patch("subprocess.run")
-    def test_execute_gh_command_failure(self, mock_run: MagicMock) -> None:
-        """Test failed execution of gh command."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="Error occurred"
-        )
 
-        client = GitHubClient()
-        result = client.execute_command(["gh", "repo", "create", "test-repo"])
+@pytest.fixture(autouse=True)
+def _gh_on_path(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Pretend gh and bash are on PATH and reset the cached lookups around each test."""
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
+    github._locate_gh.cache_clear()
+    github._locate_bash.cache_clear()
+    yield
+    github._locate_gh.cache_clear()
+    github._locate_bash.cache_clear()
 
-        assert result["success"] is False
 
-    @patch("subprocess.run")
-    def test_execute_gh_command_auth_error(self, mock_run: MagicMock) -> None:
-        """Test handling authentication failure."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="authentication required"
-        )
+def _unbatched(calls: Iterable[list[str]]) -> list[list[str]]:
+    """Expand ``bash -c`` batches back into their individual argvs."""
+    argvs: list[list[str]] = []
+    for argv in calls:
+        if argv[:2] == ["bash", "-c"]:
+            argvs.extend(shlex.split(step) for step in _BATCH_STEP.findall(argv[2]))
+        else:
+            argvs.append(argv)
+    return argvs
 
-        client = GitHubClient()
-        result = client.execute_command(["gh", "auth", "status"])
 
-        assert result["success"] is False
-        assert "authentication" in result.get("error", "").lower()
+@pytest.fixture
+def stub_run(monkeypatch: pytest.MonkeyPatch) -> StubRun:
+    """Install a `_RunStub` as subprocess.run.
 
-    @patch("subprocess.run")
-    def test_execute_gh_command_rate_limit(self, mock_run: MagicMock) -> None:
-        """Test handling rate limit error."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="API rate limit exceeded"
-        )
+    Pass a list for a fixed sequence of results (like ``side_effect``) or a
+    single result to return it on every call (like ``return_value``).
+    """
 
-        client = GitHubClient()
-        result = client.execute_command(["gh", "api", "user"])
+    def install(results: Any) -> _RunStub:
+        if not isinstance(results, list):
+            results = itertools.repeat(results)
+        stub = _RunStub(results)
+        monkeypatch.setattr("subprocess.run", stub)
+        return stub
 
-        assert result["success"] is False
+    return install
+
+
+class TestBuildCreateRepoCommand:
+    """Tests for building gh repo create command."""
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_present,expected_absent",
+        [
+            pytest.param(
+                {"public": True},
+                ["gh", "repo", "create", "test-repo", "--public"],
+                # No --template flag when no template repo is provided
+                ["--template"],
+                id="basic",
+            ),
+            pytest.param({"org": "my-org"}, ["my-org/test-repo"], [], id="org"),
+            pytest.param({"public": False}, ["--private"], ["--public"], id="private"),
+            pytest.param(
+                {"description": "Test description"},
+                ["--description", "Test description"],
+                [],
+                id="description",
+            ),
+            pytest.param(
+                {"template_repo": "owner/template-repo"},
+                ["--template", "owner/template-repo"],
+                [],
+                id="template_repo",
+            ),
+            pytest.param(
+                {"source_path": "/tmp/workspace"},
+                ["--source", "/tmp/workspace", "--push"],
+                [],
+                id="source_path",
+            ),
+            pytest.param({}, [], ["--source", "--push"], id="without_source_path"),
+        ],
+    )
+    def test_build_create_command(
+        self,
+        gh_client: GitHubClient,
+        kwargs: dict[str, Any],
+        expected_present: list[str],
+        expected_absent: list[str],
+    ) -> None:
+        """Test building gh repo create commands for each option."""
+        cmd = gh_client.build_create_command("test-repo", **kwargs)
+
+        assert all(x in cmd for x in expected_present), cmd
+        assert not any(x in cmd for x in expected_absent), cmd
+
+
+class TestGhCommandBranching:
+    """Tests for success/failure branching on gh subprocess results."""
+
+    @pytest.mark.parametrize(
+        "method,args,run_result,expected",
+        [
+            pytest.param(
+                "execute_command",
+                (["gh", "repo", "create", "test-repo"],),
+                _OK_REPO_JSON,
+                {"success": True},
+                id="execute_success",
+            ),
+            pytest.param(
+                "execute_command",
+                (["gh", "repo", "create", "test-repo"],),
+                _FAIL,
+                {"success": False},
+                id="execute_failure",
+            ),
+            pytest.param(
+                "execute_command",
+                (["gh", "auth", "status"],),
+                _FAIL_AUTH,
+                {"success": False, "error": "authentication required"},
+                id="execute_auth_error",
+            ),
+            pytest.param(
+                "execute_command",
+                (["gh", "api", "user"],),
+                _FAIL_RATE_LIMIT,
+                {"success": False},
+                id="execute_rate_limit",
+            ),
+            pytest.param("check_gh_installed", (), _OK_GH_VERSION, True, id="gh_installed"),
+            pytest.param(
+                "check_gh_installed", (), FileNotFoundError(), False, id="gh_not_installed"
+            ),
+            pytest.param("check_authentication", (), _OK_LOGGED_IN, True, id="authenticated"),
+            pytest.param(
+                "check_authentication", (), _FAIL_NOT_LOGGED_IN, False, id="not_authenticated"
+            ),
+        ],
+    )
+    def test_gh_command_branch(
+        self,
+        stub_run: StubRun,
+        gh_client: GitHubClient,
+        method: str,
+        args: tuple[Any, ...],
+        run_result: Any,
+        expected: bool | dict[str, Any],
+    ) -> None:
+        """Test each gh call maps the subprocess outcome to the right result."""
+        run = stub_run(run_result)
+
+        result = getattr(gh_client, method)(*args)
+
+        if isinstance(expected, dict):
+            assert {key: result.get(key) for key in expected} == expected
+        else:
+            assert result is expected
+        run.assert_called_once()
+
+
+class TestLocateGh:
+    """Tests for the cached gh PATH lookup."""
+
+    def test_validate_gh_installed_cached(
+        self, stub_run: StubRun, gh_client: GitHubClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test PATH is searched for gh only once across repeated checks."""
+        lookups: list[str] = []
+        monkeypatch.setattr("shutil.which", lambda name: lookups.append(name) or "/usr/bin/gh")
+        stub_run(_OK_GH_VERSION)
+
+        results = [gh_client.check_gh_installed() for _ in range(3)]
+
+        assert results == [True, True, True]
+        assert lookups == ["gh"]
+
+    def test_validate_gh_not_on_path(
+        self, stub_run: StubRun, gh_client: GitHubClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a missing gh is reported without spawning a subprocess."""
+        monkeypatch.setattr("shutil.which", lambda name: None)
+        run = stub_run([])
+
+        assert gh_client.check_gh_installed() is False
+        run.assert_not_called()
+
+
+class TestStatusCache:
+    """Tests for the per-client gh install/auth check cache."""
+
+    @pytest.mark.parametrize(
+        ("method", "run_result"),
+        [
+            ("check_gh_installed", _OK_GH_VERSION),
+            ("check_authentication", _OK_LOGGED_IN),
+        ],
+    )
+    def test_check_runs_once(self, stub_run: StubRun, gh_client: GitHubClient, method: str, run_result: Any) -> None:
+        """Repeated checks within the TTL reuse the first result."""
+        run = stub_run(run_result)
+
+        results = [getattr(gh_client, method)() for _ in range(3)]
+
+        assert results == [True, True, True]
+        run.assert_called_once()
+
+    def test_check_reruns_after_ttl(self, stub_run: StubRun, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An expired result is re-checked, so auth changes are picked up."""
+        clock = iter([0.0, 5.0, 11.0])
+        monkeypatch.setattr("time.monotonic", lambda: next(clock))
+        run = stub_run([_OK_LOGGED_IN, _FAIL_NOT_LOGGED_IN])
+        client = GitHubClient(ttl_seconds=10)
+
+        results = [client.check_authentication() for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert run.call_count == 2
 
 
 class TestDryRun:
     """Tests for dry-run mode."""
 
-    def test_dry_run_does_not_execute(self) -> None:
+    def test_dry_run_does_not_execute(self, gh_client_dry: GitHubClient) -> None:
         """Test dry run builds but doesn't run commands."""
-        client = GitHubClient(dry_run=True)
-        cmd = client.build_create_command("test-repo")
+        cmd = gh_client_dry.build_create_command("test-repo")
 
         # Dry run should return command without executing
         assert isinstance(cmd, list)
         assert "gh" in cmd
 
-    @patch("subprocess.run")
-    def test_dry_run_no_subprocess_call(self, mock_run: MagicMock) -> None:
+    def test_dry_run_no_subprocess_call(self, stub_run: StubRun, gh_client_dry: GitHubClient) -> None:
         """Test that dry run doesn't call subprocess."""
-        client = GitHubClient(dry_run=True)
-        result = client.create_repository("test-repo", Path("/tmp/test"))
+        run = stub_run([])
+
+        result = gh_client_dry.create_repository("test-repo", Path("/tmp/test"))
 
         # Should not call subprocess.run
-        mock_run.assert_not_called()
+        run.assert_not_called()
         assert "dry_run" in result or result.get("success") is True
 
 
-class TestValidateGh:
-    """Tests for gh CLI validation."""
-
-    @patch("subprocess.run")
-    def test_validate_gh_installed(self, mock_run: MagicMock) -> None:
-        """Test checking gh CLI availability."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="gh version 2.0.0")
-
-        client = GitHubClient()
-        is_installed = client.check_gh_installed()
-
-        assert is_installed is True
-
-    @patch("subprocess.run")
-    def test_validate_gh_not_installed(self, mock_run: MagicMock) -> None:
-        """Test handling missing gh CLI."""
-        mock_run.side_effect = FileNotFoundError()
-
-        client = GitHubClient()
-        is_installed = client.check_gh_installed()
-
-        assert is_installed is False
-
-    @patch("subprocess.run")
-    def test_validate_gh_authenticated(self, mock_run: MagicMock) -> None:
-        """Test checking gh authentication status."""
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="Logged in to github.com"
-        )
-
-        client = GitHubClient()
-        is_authenticated = client.check_authentication()
-
-        assert is_authenticated is True
-
-    @patch("subprocess.run")
-    def test_validate_gh_not_authenticated(self, mock_run: MagicMock) -> None:
-        """Test detecting unauthenticated state."""
-        mock_run.return_value = MagicMock(returncode=1, stderr="not logged in")
-
-        client = GitHubClient()
-        is_authenticated = client.check_authentication()
-
-        assert is_authenticated is False
+_JSON_INPUT = '{"name": "test-repo", "html_url": "https://github.com/user/test-repo"}'
+_EXPECTED = {"name": "test-repo", "html_url": "https://github.com/user/test-repo"}
 
 
 class TestParseGhOutput:
     """Tests for parsing gh JSON output."""
 
-    def test_parse_gh_json_output(self) -> None:
+    def test_parse_gh_json_output(self, gh_client: GitHubClient) -> None:
         """Test parsing JSON response from gh."""
-        client = GitHubClient()
-        output = '{"name": "test-repo", "html_url": "https://github.com/user/test-repo"}'
-
-        parsed: dict[str, Any] = client.parse_json_output(output)
-
-        assert parsed["name"] == "test-repo"
-        assert "html_url" in parsed
+        assert gh_client.parse_json_output(_JSON_INPUT) == _EXPECTED
 
-    def test_parse_gh_invalid_json(self) -> None:
+    def test_parse_gh_invalid_json(self, gh_client: GitHubClient) -> None:
         """Test handling invalid JSON."""
-        client = GitHubClient()
         output = "Not valid JSON"
 
         with pytest.raises(ValueError):
-            client.parse_json_output(output)
+            gh_client.parse_json_output(output)
+
+    def test_parse_gh_json_without_orjson(self, gh_client: GitHubClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the stdlib fallback parses the same output."""
+        monkeypatch.setattr(github, "orjson", None)
+
+        assert gh_client.parse_json_output(_JSON_INPUT) == _EXPECTED
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            gh_client.parse_json_output("Not valid JSON")
 
 
 class TestCreateRepository:
     """Tests for repository creation."""
 
-    @patch("subprocess.run")
-    def test_create_repository_success(self, mock_run: MagicMock, temp_dir: Path) -> None:
-        """Test successful repository creation."""
-        # Return value that works for all subprocess calls
-        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n", stderr="")
+    @pytest.fixture
+    def shell(self, fake_shell: FakeShell) -> FakeShell:
+        """Fake shell answering the gh calls made by create_repository."""
+        fake_shell.set_response(("gh", "repo", "create"), _OK_REPO_JSON)
+        fake_shell.set_response(("gh", "api", "user"), _OK_USER)
+        return fake_shell
 
-        client = GitHubClient()
-        result = client.create_repository("test-repo", temp_dir)
+    def test_create_repository_success(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
+        """Test successful repository creation."""
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
 
         assert result["success"] is True
-        # Verify git init was called
-        git_calls = [c for c in mock_run.call_args_list if "git" in str(c)]
-        assert len(git_calls) > 0
+        # Verify git was called
+        assert any(argv[0] == "git" for argv in _unbatched(shell.calls))
 
-    @patch("subprocess.run")
-    def test_create_repository_initializes_git(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_create_repository_initializes_git(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Test that create_repository initializes git and commits files."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n", stderr="")
-
-        client = GitHubClient()
-        result = client.create_repository("test-repo", temp_dir)
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
 
         assert result["success"] is True
+        argvs = _unbatched(shell.calls)
         # Verify git init was called
-        git_init_call = [c for c in mock_run.call_args_list if "git" in str(c) and "init" in str(c)]
-        assert len(git_init_call) > 0
+        assert ["git", "init"] in argvs
         # Verify git commit was called
-        git_commit_call = [c for c in mock_run.call_args_list if "commit" in str(c)]
-        assert len(git_commit_call) > 0
+        assert any(argv[:2] == ["git", "commit"] for argv in argvs)
 
-    @patch("subprocess.run")
-    def test_create_repository_skips_git_on_retry(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_create_repository_skips_git_on_retry(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Test that create_repository skips git operations when skip_git_operations=True."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout='{"name": "test-repo"}', stderr=""),  # gh repo create
-            MagicMock(returncode=0, stdout="testuser\n", stderr=""),  # gh api user
-            MagicMock(returncode=0, stdout="", stderr=""),  # gh repo edit --template
-        ]
-
-        client = GitHubClient()
-        result = client.create_repository("test-repo", temp_dir, skip_git_operations=True)
+        result = gh_client.create_repository("test-repo", shared_empty_dir, skip_git_operations=True)
 
         assert result["success"] is True
-        # Verify git init was NOT called
-        git_init_calls = [c for c in mock_run.call_args_list if "init" in str(c)]
-        assert len(git_init_calls) == 0
+        # Only gh repo create, gh api user and gh repo edit --template run
+        assert [argv[:3] for argv in shell.calls] == [
+            ["gh", "repo", "create"],
+            ["gh", "api", "user"],
+            ["gh", "repo", "edit"],
+        ]
 
-    @patch("subprocess.run")
-    def test_create_repository_marks_template(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_create_repository_marks_template(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Ensure repositories are marked as templates when requested."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n", stderr="")
-
-        client = GitHubClient()
-        result = client.create_repository("test-repo", temp_dir)
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
 
         assert result["success"] is True
         # Verify gh repo edit was called with --template
-        template_call = [c for c in mock_run.call_args_list if "--template" in str(c)]
-        assert len(template_call) > 0
+        assert shell.calls[-1] == ["gh", "repo", "edit", "testuser/test-repo", "--template"]
 
-    @patch("subprocess.run")
-    def test_create_repository_includes_source_and_push_flags(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_create_repository_includes_source_and_push_flags(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Test that gh repo create includes --source and --push flags."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n", stderr="")
-
-        client = GitHubClient()
-        result = client.create_repository("test-repo", temp_dir)
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
 
         assert result["success"] is True
         # Find the gh repo create call
-        gh_create_calls = [c for c in mock_run.call_args_list if "gh" in str(c) and "create" in str(c)]
-        assert len(gh_create_calls) > 0
+        gh_create_calls = [argv for argv in _unbatched(shell.calls) if argv[:3] == ["gh", "repo", "create"]]
+        assert len(gh_create_calls) == 1
         # Verify it includes --source and --push
-        create_call_args = str(gh_create_calls[0])
-        assert "--source" in create_call_args
-        assert "--push" in create_call_args
+        assert "--source" in gh_create_calls[0]
+        assert "--push" in gh_create_calls[0]
 
-    @patch("subprocess.run")
-    def test_create_repository_with_push(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_create_repository_with_push(self, shell: FakeShell, temp_dir: Path, gh_client: GitHubClient) -> None:
         """Test repository creation with initial push."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n", stderr="")
-
         # Create a dummy file in temp_dir
         (temp_dir / "README.md").write_text("Test")
 
-        client = GitHubClient()
-        client.create_repository("test-repo", temp_dir)
+        gh_client.create_repository("test-repo", temp_dir)
 
         # Should have called git commands
-        assert mock_run.call_count >= 1
+        assert len(shell.calls) >= 1
+
+    @pytest.mark.skipif(os.name != "posix", reason="batching runs through bash on POSIX only")
+    def test_create_repository_batches_git_steps(self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
+        """git init/add/commit run as one bash process; gh repo create runs on its own."""
+        gh_client.create_repository("test-repo", shared_empty_dir)
+
+        batches = [argv for argv in shell.calls if argv[:2] == ["bash", "-c"]]
+        assert len(batches) == 1
+        argvs = _unbatched(batches)
+        assert argvs[0] == ["git", "init"]
+        assert argvs[-1] == ["git", "commit", "-m", "Initial commit"]
+        assert not any(argv[:2] in (["git", "init"], ["git", "commit"]) for argv in shell.calls)
+        assert any(argv[:3] == ["gh", "repo", "create"] for argv in shell.calls)
+
+    def test_create_repository_without_bash_runs_sequentially(
+        self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without bash each command is its own process, stopping at the first failure."""
+        monkeypatch.setattr("shutil.which", lambda name: None if name == "bash" else f"/usr/bin/{name}")
+        shell.set_response(("git", "commit"), _FAIL_NOTHING_TO_COMMIT)
+
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
+
+        assert result["success"] is False
+        assert result["failed_command"] == "git commit -m 'Initial commit'"
+        # git commit reports this on stdout, with nothing on stderr
+        assert "nothing to commit" in result["error"]
+        assert ["git", "init"] in shell.calls
+        assert not any(argv[:2] == ["bash", "-c"] for argv in shell.calls)
+        assert not any(argv[:3] == ["gh", "repo", "create"] for argv in shell.calls)
+
+    def test_create_repository_does_not_batch_off_posix(
+        self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """On Windows the bash on PATH may be WSL's, so commands run one by one."""
+        monkeypatch.setattr(github, "os", SimpleNamespace(name="nt"))
+
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
+
+        assert result["success"] is True
+        assert not any(argv[:2] == ["bash", "-c"] for argv in shell.calls)
+        assert ["git", "init"] in shell.calls
+
+    @pytest.mark.skipif(os.name != "posix", reason="batching runs through bash on POSIX only")
+    def test_create_repository_reports_failing_git_step(
+        self, gh_client: GitHubClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed git step in the bash batch is named, with only its own output."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake_git = bin_dir / "git"
+        fake_git.write_text(
+            "#!/bin/sh\n"
+            'echo "hint: $1" >&2\n'
+            'if [ "$1" = commit ]; then echo "nothing to commit, working tree clean"; exit 1; fi\n'
+        )
+        fake_git.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        result = gh_client.create_repository("test-repo", workspace)
+
+        assert result["success"] is False
+        assert result["returncode"] == 1
+        assert result["failed_command"] == "git commit -m 'Initial commit'"
+        # Every git call writes a hint; only the failing step's output is kept
+        assert result["error"] == (
+            "git commit -m 'Initial commit' failed:\nhint: commit\nnothing to commit, working tree clean"
+        )
+
+    def test_create_repository_reports_gh_error_alone(
+        self, shell: FakeShell, shared_empty_dir: Path, gh_client: GitHubClient
+    ) -> None:
+        """A gh repo create failure returns gh's stderr untouched by the git steps."""
+        shell.set_response(("bash", "-c"), MagicMock(returncode=0, stdout="", stderr="hint: git noise"))
+        shell.set_response(("gh", "repo", "create"), _FAIL_INTEGRATION)
+
+        result = gh_client.create_repository("test-repo", shared_empty_dir)
+
+        assert result["success"] is False
+        assert result["error"] == _FAIL_INTEGRATION.stderr
+        assert not any(argv[:3] == ["gh", "repo", "edit"] for argv in shell.calls)
 
 
 class TestMarkRepositoryAsTemplate:
     """Tests for marking repositories as templates."""
 
-    @patch("subprocess.run")
-    def test_mark_repository_as_template_with_org(self, mock_run: MagicMock) -> None:
+    def test_mark_repository_as_template_with_org(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Ensure gh repo edit is invoked with org prefix."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        run = stub_run(_OK)
 
-        client = GitHubClient()
-        result = client.mark_repository_as_template("test-repo", org="my-org")
+        result = gh_client.mark_repository_as_template("test-repo", org="my-org")
 
         assert result["success"] is True
-        mock_run.assert_called_with(
-            ["gh", "repo", "edit", "my-org/test-repo", "--template"],
-            capture_output=True,
-            text=True,
-            check=False,
+        assert run.calls[-1] == (
+            (["gh", "repo", "edit", "my-org/test-repo", "--template"],),
+            {"capture_output": True, "text": True, "check": False},
         )
 
-    @patch("subprocess.run")
-    def test_mark_repository_as_template_without_org_gets_user(self, mock_run: MagicMock) -> None:
+    def test_mark_repository_as_template_without_org_gets_user(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Ensure gh repo edit gets authenticated user when no org specified."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="testuser\n", stderr=""),  # gh api user
-            MagicMock(returncode=0, stdout="", stderr=""),  # gh repo edit
-        ]
+        run = stub_run([
+            _OK_USER,  # gh api user
+            _OK,  # gh repo edit
+        ])
 
-        client = GitHubClient()
-        result = client.mark_repository_as_template("test-repo")
+        result = gh_client.mark_repository_as_template("test-repo")
 
         assert result["success"] is True
         # Verify gh api user was called
-        assert mock_run.call_args_list[0][0][0] == ["gh", "api", "user", "--jq", ".login"]
+        assert run.calls[0][0][0] == ["gh", "api", "user", "--cache", "1h", "--jq", ".login"]
         # Verify gh repo edit was called with username/repo
-        assert mock_run.call_args_list[1][0][0] == ["gh", "repo", "edit", "testuser/test-repo", "--template"]
+        assert run.calls[1][0][0] == ["gh", "repo", "edit", "testuser/test-repo", "--template"]
 
-    @patch("subprocess.run")
-    def test_mark_repository_as_template_user_api_failure(self, mock_run: MagicMock) -> None:
+    def test_mark_repository_as_template_user_api_failure(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test handling failure to get authenticated user."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Not authenticated")
+        stub_run(MagicMock(returncode=1, stdout="", stderr="Not authenticated"))
 
-        client = GitHubClient()
-        result = client.mark_repository_as_template("test-repo")
+        result = gh_client.mark_repository_as_template("test-repo")
 
         assert result["success"] is False
         assert "Failed to get authenticated user" in result["error"]
 
+    def test_mark_repository_as_template_caches_login(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
+        """The authenticated login is looked up once per client."""
+        run = stub_run([_OK_USER, _OK, _OK])
+
+        gh_client.mark_repository_as_template("first-repo")
+        result = gh_client.mark_repository_as_template("second-repo")
+
+        assert result["success"] is True
+        assert run.argvs() == [
+            ["gh", "api", "user", "--cache", "1h", "--jq", ".login"],
+            ["gh", "repo", "edit", "testuser/first-repo", "--template"],
+            ["gh", "repo", "edit", "testuser/second-repo", "--template"],
+        ]
+
 
 class TestGitOperations:
     """Tests for git operations."""
 
-    @patch("subprocess.run")
-    def test_init_git_repo(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_init_git_repo(self, stub_run: StubRun, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Test initializing git repository."""
-        mock_run.return_value = MagicMock(returncode=0)
+        run = stub_run(MagicMock(returncode=0))
 
-        client = GitHubClient()
-        client.init_git_repo(temp_dir)
+        gh_client.init_git_repo(shared_empty_dir)
 
         # Should call git init
-        assert any("git" in str(call) for call in mock_run.call_args_list)
+        assert any(args and args[0][:2] == ["git", "init"] for args, _ in run.calls)
 
-    @patch("subprocess.run")
-    def test_commit_files_with_global_config(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_commit_files_with_global_config(self, stub_run: StubRun, temp_dir: Path, gh_client: GitHubClient) -> None:
         """Test committing files with global git config."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="Test User\n", stderr=""),  # git config --global user.name
-            MagicMock(returncode=0, stdout="test@example.com\n", stderr=""),  # git config --global user.email
-            MagicMock(returncode=0, stdout="", stderr=""),  # git add
-            MagicMock(returncode=0, stdout="", stderr=""),  # git commit
-        ]
+        run = stub_run([
+            _OK_GIT_IDENTITY,  # git config --global --get-regexp ^user\.
+            _OK,  # git add
+            _OK,  # git commit
+        ])
 
         (temp_dir / "test.txt").write_text("test")
 
-        client = GitHubClient()
-        client.commit_files(temp_dir, "Initial commit")
+        gh_client.commit_files(temp_dir, "Initial commit")
 
-        # Should call git add and git commit
-        assert mock_run.call_count == 4
+        # Should call git config, git add and git commit
+        assert run.call_count == 3
 
-    @patch("subprocess.run")
-    def test_commit_files_sets_local_config_when_global_missing(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_commit_files_sets_local_config_when_global_missing(self, stub_run: StubRun, temp_dir: Path, gh_client: GitHubClient) -> None:
         """Test that commit_files sets local config when global config is missing."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # git config --global user.name (empty)
-            MagicMock(returncode=0, stdout="", stderr=""),  # git config --global user.email (empty)
-            MagicMock(returncode=0, stdout="", stderr=""),  # git config user.name (set local)
-            MagicMock(returncode=0, stdout="", stderr=""),  # git config user.email (set local)
-            MagicMock(returncode=0, stdout="", stderr=""),  # git add
-            MagicMock(returncode=0, stdout="", stderr=""),  # git commit
-        ]
+        run = stub_run([
+            _OK,  # git config --global --get-regexp ^user\. (nothing set)
+            _OK,  # git config user.name (set local)
+            _OK,  # git config user.email (set local)
+            _OK,  # git add
+            _OK,  # git commit
+        ])
 
         (temp_dir / "test.txt").write_text("test")
 
-        client = GitHubClient()
-        client.commit_files(temp_dir, "Initial commit")
+        gh_client.commit_files(temp_dir, "Initial commit")
 
         # Verify local git config was set
-        local_config_calls = [c for c in mock_run.call_args_list if "git" in str(c) and "config" in str(c) and "user.name" in str(c)]
-        assert len(local_config_calls) >= 2  # One global check, one local set
+        argvs = run.argvs()
+        assert ["git", "config", "user.name", "Template CLI"] in argvs
+        assert ["git", "config", "user.email", "template-cli@example.com"] in argvs
+        assert run.call_count == 5
 
-    @patch("subprocess.run")
-    def test_commit_files_provides_detailed_error(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_commit_files_provides_detailed_error(self, stub_run: StubRun, temp_dir: Path, gh_client: GitHubClient) -> None:
         """Test that commit_files provides detailed error messages on failure."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="Test User\n", stderr=""),  # git config user.name
-            MagicMock(returncode=0, stdout="test@example.com\n", stderr=""),  # git config user.email
-            MagicMock(returncode=0, stdout="", stderr=""),  # git add
+        stub_run([
+            _OK_GIT_IDENTITY,  # git config --global --get-regexp ^user\.
+            _OK,  # git add
             MagicMock(returncode=1, stdout="nothing to commit", stderr="fatal: no changes"), # git commit fails
-        ]
+        ])
 
         (temp_dir / "test.txt").write_text("test")
 
-        client = GitHubClient()
         with pytest.raises(RuntimeError) as exc_info:
-            client.commit_files(temp_dir, "Initial commit")
+            gh_client.commit_files(temp_dir, "Initial commit")
         
         assert "git commit failed" in str(exc_info.value)
         assert "nothing to commit" in str(exc_info.value)
 
-    @patch("subprocess.run")
-    def test_commit_files(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_commit_files(self, stub_run: StubRun, temp_dir: Path, gh_client: GitHubClient) -> None:
         """Test committing files."""
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="Test User\n", stderr=""),
-            MagicMock(returncode=0, stdout="test@example.com\n", stderr=""),
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="", stderr=""),
-        ]
+        run = stub_run([
+            _OK_GIT_IDENTITY,
+            _OK,
+            _OK,
+        ])
 
         (temp_dir / "test.txt").write_text("test")
 
-        client = GitHubClient()
-        client.commit_files(temp_dir, "Initial commit")
+        gh_client.commit_files(temp_dir, "Initial commit")
 
         # Should call git add and git commit
-        assert mock_run.call_count >= 2
+        assert run.call_count >= 2
 
-    @patch("subprocess.run")
-    def test_push_to_remote(self, mock_run: MagicMock, temp_dir: Path) -> None:
+    def test_push_to_remote(self, stub_run: StubRun, shared_empty_dir: Path, gh_client: GitHubClient) -> None:
         """Test pushing to remote."""
-        mock_run.return_value = MagicMock(returncode=0)
+        run = stub_run(MagicMock(returncode=0))
 
-        client = GitHubClient()
-        client.push_to_remote(temp_dir, "https://github.com/user/test-repo")
+        gh_client.push_to_remote(shared_empty_dir, "https://github.com/user/test-repo")
 
         # Should call git push
-        assert any("push" in str(call) for call in mock_run.call_args_list)
+        assert any(args and args[0][:2] == ["git", "push"] for args, _ in run.calls)
 
 
 class TestScopeChecking:
     """Tests for GitHub authentication scope checking."""
 
-    @patch("subprocess.run")
-    def test_check_scopes_with_required_scopes(self, mock_run: MagicMock) -> None:
+    def test_check_scopes_with_required_scopes(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test scope checking when required scopes are present."""
-        mock_run.return_value = MagicMock(
+        stub_run(MagicMock(
             returncode=0,
             stdout="",
             stderr="  - Token scopes: 'gist', 'read:org', 'repo', 'workflow'"
-        )
+        ))
 
-        client = GitHubClient()
-        result = client.check_scopes(["repo"])
+        result = gh_client.check_scopes(["repo"])
 
         assert result["authenticated"] is True
         assert result["has_scopes"] is True
         assert "repo" in result["scopes"]
         assert result["missing_scopes"] == []
 
-    @patch("subprocess.run")
-    def test_check_scopes_with_missing_scopes(self, mock_run: MagicMock) -> None:
+    def test_check_scopes_with_missing_scopes(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test scope checking when required scopes are missing."""
-        mock_run.return_value = MagicMock(
+        stub_run(MagicMock(
             returncode=0,
             stdout="",
             stderr="  - Token scopes: 'read:org'"
-        )
+        ))
 
-        client = GitHubClient()
-        result = client.check_scopes(["repo", "workflow"])
+        result = gh_client.check_scopes(["repo", "workflow"])
 
         assert result["authenticated"] is True
         assert result["has_scopes"] is False
@@ -506,46 +671,40 @@ class TestScopeChecking:
         assert "repo" in result["missing_scopes"]
         assert "workflow" in result["missing_scopes"]
 
-    @patch("subprocess.run")
-    def test_check_scopes_not_authenticated(self, mock_run: MagicMock) -> None:
+    def test_check_scopes_not_authenticated(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test scope checking when not authenticated."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="")
+        stub_run(MagicMock(returncode=1, stdout="", stderr=""))
 
-        client = GitHubClient()
-        result = client.check_scopes(["repo"])
+        result = gh_client.check_scopes(["repo"])
 
         assert result["authenticated"] is False
         assert result["has_scopes"] is False
         assert result["scopes"] == []
         assert "repo" in result["missing_scopes"]
 
-    @patch("subprocess.run")
-    def test_check_scopes_default_repo_scope(self, mock_run: MagicMock) -> None:
+    def test_check_scopes_default_repo_scope(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test scope checking defaults to 'repo' scope."""
-        mock_run.return_value = MagicMock(
+        stub_run(MagicMock(
             returncode=0,
             stdout="",
             stderr="  - Token scopes: 'repo'"
-        )
+        ))
 
-        client = GitHubClient()
-        result = client.check_scopes()  # No scopes specified
+        result = gh_client.check_scopes()  # No scopes specified
 
         assert result["authenticated"] is True
         assert result["has_scopes"] is True
         assert "repo" in result["scopes"]
 
-    @patch("subprocess.run")
-    def test_check_scopes_parses_multiple_formats(self, mock_run: MagicMock) -> None:
+    def test_check_scopes_parses_multiple_formats(self, stub_run: StubRun, gh_client: GitHubClient) -> None:
         """Test scope parsing handles different quote styles."""
-        mock_run.return_value = MagicMock(
+        stub_run(MagicMock(
             returncode=0,
             stdout="  - Token scopes: 'gist', \"read:org\", repo",
             stderr=""
-        )
+        ))
 
-        client = GitHubClient()
-        result = client.check_scopes(["repo"])
+        result = gh_client.check_scopes(["repo"])
 
         assert result["authenticated"] is True
         assert "repo" in result["scopes"]
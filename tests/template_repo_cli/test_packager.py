@@ -4,8 +4,65 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from scripts.template_repo_cli.core.packager import TemplatePackager
 
+pytestmark = pytest.mark.parallel_safe
+
+_SHARED_EXERCISES = ["ex001_sanity", "ex002_sequence_modify_basics"]
+
+
+def _exercise_files(repo_root: Path, *exercise_ids: str) -> dict[str, dict[str, Path]]:
+    """Notebook, solution and test paths for each exercise."""
+    return {
+        ex: {
+            "notebook": repo_root / f"notebooks/{ex}.ipynb",
+            "solution": repo_root / f"notebooks/solutions/{ex}.ipynb",
+            "test": repo_root / f"tests/test_{ex}.py",
+        }
+        for ex in exercise_ids
+    }
+
+
+def _tree(root: Path) -> frozenset[str]:
+    """Every path under root, relative and POSIX-style, from one tree walk."""
+    return frozenset(p.relative_to(root).as_posix() for p in root.rglob("*"))
+
+
+@pytest.fixture
+def fast_copy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the packager create empty destination files instead of copying.
+
+    For tests that only check which paths were created. A missing source still
+    raises, as with the real copy.
+    """
+
+    def touch_copy(source: Path, dest: Path) -> None:
+        if not source.exists():
+            raise FileNotFoundError(f"Source file not found: {source}")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.touch()
+
+    monkeypatch.setattr("scripts.template_repo_cli.core.packager.safe_copy_file", touch_copy)
+
+
+@pytest.fixture(scope="module")
+def populated_workspace(tmp_path_factory: pytest.TempPathFactory, repo_root: Path) -> Path:
+    """Workspace packaged once per module; tests must only read from it."""
+    workspace = tmp_path_factory.mktemp("populated_workspace")
+    packager = TemplatePackager(repo_root)
+    packager.copy_exercise_files(workspace, _exercise_files(repo_root, *_SHARED_EXERCISES))
+    packager.copy_template_base_files(workspace)
+    packager.generate_readme(workspace, "Test Template", _SHARED_EXERCISES)
+    return workspace
+
+
+@pytest.fixture(scope="module")
+def workspace_tree(populated_workspace: Path) -> frozenset[str]:
+    """Relative paths in the populated workspace, walked once per module."""
+    return _tree(populated_workspace)
+
 
 class TestCreateTempDirectory:
     """Tests for temporary directory creation."""
@@ -18,6 +75,12 @@ class TestCreateTempDirectory:
         assert temp_path.exists()
         assert temp_path.is_dir()
 
+    def test_create_workspace_uses_worker_temp_root(self, repo_root: Path, _worker_tmp_root: Path) -> None:
+        """Test workspaces land under this worker's private temp root."""
+        temp_path = TemplatePackager(repo_root).create_workspace()
+
+        assert temp_path.parent == _worker_tmp_root
+
     def test_create_temp_directory_unique(self, repo_root: Path) -> None:
         """Test that each workspace is unique."""
         packager = TemplatePackager(repo_root)
@@ -30,138 +93,110 @@ class TestCreateTempDirectory:
 class TestCopyFiles:
     """Tests for copying files to workspace."""
 
-    def test_copy_notebooks(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_copy_notebooks(self, workspace_tree: frozenset[str]) -> None:
         """Test copying notebooks to temp directory."""
-        packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
-        }
+        assert "notebooks/ex001_sanity.ipynb" in workspace_tree
+        assert "notebooks/solutions/ex001_sanity.ipynb" in workspace_tree
 
-        packager.copy_exercise_files(temp_dir, files)
-
-        assert (temp_dir / "notebooks/ex001_sanity.ipynb").exists()
-        assert (temp_dir / "notebooks/solutions/ex001_sanity.ipynb").exists()
-
-    def test_copy_tests(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_copy_tests(self, workspace_tree: frozenset[str]) -> None:
         """Test copying test files to temp directory."""
+        assert "tests/test_ex001_sanity.py" in workspace_tree
+
+    def test_copy_missing_source_raises(
+        self, repo_root: Path, temp_dir: Path, fast_copy: None, ex001_files: dict[str, dict[str, Path]]
+    ) -> None:
+        """Test a missing source surfaces from the concurrent copy."""
         packager = TemplatePackager(repo_root)
         files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
+            **ex001_files,
+            "ex999_missing": {"notebook": repo_root / "notebooks/ex999_missing.ipynb"},
         }
 
-        packager.copy_exercise_files(temp_dir, files)
+        with pytest.raises(FileNotFoundError, match="ex999_missing"):
+            packager.copy_exercise_files(temp_dir, files)
 
-        assert (temp_dir / "tests/test_ex001_sanity.py").exists()
-
-    def test_copy_template_files(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_copy_template_files(self, workspace_tree: frozenset[str]) -> None:
         """Test copying base template files."""
-        packager = TemplatePackager(repo_root)
-        packager.copy_template_base_files(temp_dir)
-
         # Check that base files are copied
-        assert (temp_dir / "pyproject.toml").exists()
-        assert (temp_dir / "pytest.ini").exists()
-        assert (temp_dir / ".gitignore").exists()
-
-    def test_copy_preserves_structure(self, repo_root: Path, temp_dir: Path) -> None:
+        assert {"pyproject.toml", "pytest.ini", ".gitignore"} <= workspace_tree
+
+    def test_copy_template_files_sees_new_files(self, tmp_path: Path) -> None:
+        """Test a template file added between packagings is copied the second time."""
+        template_files_dir = tmp_path / "repo" / "template_repo_files"
+        template_files_dir.mkdir(parents=True)
+        (template_files_dir / "pyproject.toml").write_text("[project]\n")
+        packager = TemplatePackager(tmp_path / "repo")
+        # Workspaces already hold the exercise tests when base files are copied
+        for workspace in ("first", "second"):
+            (tmp_path / workspace / "tests").mkdir(parents=True)
+
+        packager.copy_template_base_files(tmp_path / "first")
+        (template_files_dir / "pytest.ini").write_text("[pytest]\n")
+        packager.copy_template_base_files(tmp_path / "second")
+
+        assert not (tmp_path / "first" / "pytest.ini").exists()
+        assert (tmp_path / "second" / "pytest.ini").exists()
+
+    @pytest.mark.slow
+    def test_copy_preserves_structure(self, workspace_tree: frozenset[str]) -> None:
         """Test that directory structure is maintained."""
-        packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
-        }
-
-        packager.copy_exercise_files(temp_dir, files)
-
         # Structure should be preserved
-        assert (temp_dir / "notebooks").exists()
-        assert (temp_dir / "notebooks/solutions").exists()
-        assert (temp_dir / "tests").exists()
+        assert {"notebooks", "notebooks/solutions", "tests"} <= workspace_tree
 
 
 class TestGenerateFiles:
     """Tests for generating template files."""
 
-    def test_generate_readme(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_generate_readme(self, populated_workspace: Path) -> None:
         """Test creating custom README with exercise list."""
-        packager = TemplatePackager(repo_root)
-        exercises = ["ex001_sanity", "ex002_sequence_modify_basics"]
-
-        packager.generate_readme(temp_dir, "Test Template", exercises)
-
-        readme = temp_dir / "README.md"
+        readme = populated_workspace / "README.md"
         assert readme.exists()
         content = readme.read_text()
         assert "Test Template" in content
         assert "ex001_sanity" in content
 
-    def test_generate_gitignore(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_generate_gitignore(self, populated_workspace: Path) -> None:
         """Test creating appropriate .gitignore."""
-        packager = TemplatePackager(repo_root)
-        packager.copy_template_base_files(temp_dir)
-
-        gitignore = temp_dir / ".gitignore"
+        gitignore = populated_workspace / ".gitignore"
         assert gitignore.exists()
         content = gitignore.read_text()
         assert "__pycache__" in content
 
-    def test_generate_workflow(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_generate_workflow(self, workspace_tree: frozenset[str]) -> None:
         """Test creating GitHub Actions workflow."""
-        packager = TemplatePackager(repo_root)
-        packager.copy_template_base_files(temp_dir)
-
-        workflow = temp_dir / ".github/workflows/tests.yml"
-        assert workflow.exists()
+        assert ".github/workflows/tests.yml" in workspace_tree
 
 
 class TestPackageIntegrity:
     """Tests for package validation."""
 
-    def test_package_integrity_check(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_package_integrity_check(self, repo_root: Path, populated_workspace: Path) -> None:
         """Test validating package completeness."""
         packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
-        }
-
-        packager.copy_exercise_files(temp_dir, files)
-        packager.copy_template_base_files(temp_dir)
-        packager.generate_readme(temp_dir, "Test", ["ex001_sanity"])
 
         # Validate package
-        is_valid = packager.validate_package(temp_dir)
+        is_valid = packager.validate_package(populated_workspace)
         assert is_valid is True
 
-    def test_package_integrity_missing_files(self, repo_root: Path, temp_dir: Path) -> None:
+    def test_package_integrity_missing_files(self, repo_root: Path, shared_empty_dir: Path) -> None:
         """Test validation fails with missing required files."""
         packager = TemplatePackager(repo_root)
 
         # Don't copy all required files
-        is_valid = packager.validate_package(temp_dir)
+        is_valid = packager.validate_package(shared_empty_dir)
         assert is_valid is False
 
-    def test_package_has_notebook_grader(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_package_has_notebook_grader(self, workspace_tree: frozenset[str]) -> None:
         """Test that notebook_grader.py is included."""
-        packager = TemplatePackager(repo_root)
-        packager.copy_template_base_files(temp_dir)
-
-        grader = temp_dir / "tests/notebook_grader.py"
-        assert grader.exists()
+        assert "tests/notebook_grader.py" in workspace_tree
 
 
 class TestPackageCleanup:
@@ -183,62 +218,30 @@ class TestPackageOptions:
     """Tests for package options."""
 
     def test_package_excludes_solutions_option(
-        self, repo_root: Path, temp_dir: Path
+        self, repo_root: Path, temp_dir: Path, fast_copy: None, ex001_files: dict[str, dict[str, Path]]
     ) -> None:
         """Test optional solution exclusion."""
         packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
-        }
 
-        packager.copy_exercise_files(temp_dir, files, include_solutions=False)
+        packager.copy_exercise_files(temp_dir, ex001_files, include_solutions=False)
 
-        assert (temp_dir / "notebooks/ex001_sanity.ipynb").exists()
-        assert not (temp_dir / "notebooks/solutions/ex001_sanity.ipynb").exists()
+        tree = _tree(temp_dir)
+        assert "notebooks/ex001_sanity.ipynb" in tree
+        assert "notebooks/solutions/ex001_sanity.ipynb" not in tree
 
-    def test_package_includes_solutions_by_default(
-        self, repo_root: Path, temp_dir: Path
-    ) -> None:
+    @pytest.mark.slow
+    def test_package_includes_solutions_by_default(self, workspace_tree: frozenset[str]) -> None:
         """Test solutions are included by default."""
-        packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            }
-        }
-
-        packager.copy_exercise_files(temp_dir, files)
-
-        assert (temp_dir / "notebooks/solutions/ex001_sanity.ipynb").exists()
+        assert "notebooks/solutions/ex001_sanity.ipynb" in workspace_tree
 
 
 class TestPackageMultipleExercises:
     """Tests for packaging multiple exercises."""
 
-    def test_package_multiple_exercises(self, repo_root: Path, temp_dir: Path) -> None:
+    @pytest.mark.slow
+    def test_package_multiple_exercises(self, workspace_tree: frozenset[str]) -> None:
         """Test packaging multiple exercises together."""
-        packager = TemplatePackager(repo_root)
-        files = {
-            "ex001_sanity": {
-                "notebook": repo_root / "notebooks/ex001_sanity.ipynb",
-                "solution": repo_root / "notebooks/solutions/ex001_sanity.ipynb",
-                "test": repo_root / "tests/test_ex001_sanity.py",
-            },
-            "ex002_sequence_modify_basics": {
-                "notebook": repo_root / "notebooks/ex002_sequence_modify_basics.ipynb",
-                "solution": repo_root
-                / "notebooks/solutions/ex002_sequence_modify_basics.ipynb",
-                "test": repo_root / "tests/test_ex002_sequence_modify_basics.py",
-            },
-        }
+        assert "notebooks/ex001_sanity.ipynb" in workspace_tree
+        assert "notebooks/ex002_sequence_modify_basics.ipynb" in workspace_tree
 
-        packager.copy_exercise_files(temp_dir, files)
 
-        assert (temp_dir / "notebooks/ex001_sanity.ipynb").exists()
-        assert (temp_dir / "notebooks/ex002_sequence_modify_basics.ipynb").exists()
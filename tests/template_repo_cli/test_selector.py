@@ -2,43 +2,38 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
-from scripts.template_repo_cli.core.selector import ExerciseSelector
+from scripts.template_repo_cli.core.selector import ExerciseSelector, scan_notebooks
 
 
 class TestSelectByConstruct:
     """Tests for selecting exercises by construct."""
 
-    def test_select_by_single_construct(self, repo_root: Path) -> None:
+    def test_select_by_single_construct(self, selector: ExerciseSelector) -> None:
         """Test selecting all exercises in one construct."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_construct(["sequence"])
 
         assert len(exercises) > 0
         assert all("sequence" in str(ex).lower() for ex in exercises)
 
-    def test_select_by_multiple_constructs(self, repo_root: Path) -> None:
+    def test_select_by_multiple_constructs(self, selector: ExerciseSelector) -> None:
         """Test selecting from multiple constructs."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_construct(["sequence", "selection"])
 
         assert len(exercises) > 0
         # Should contain exercises from both constructs
 
-    def test_select_invalid_construct(self, repo_root: Path) -> None:
+    def test_select_invalid_construct(self, selector: ExerciseSelector) -> None:
         """Test selecting invalid construct raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="Invalid construct"):
             selector.select_by_construct(["invalid_construct"])
 
-    def test_select_empty_construct_list(self, repo_root: Path) -> None:
+    def test_select_empty_construct_list(self, selector: ExerciseSelector) -> None:
         """Test selecting with empty construct list raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="At least one construct"):
             selector.select_by_construct([])
 
@@ -46,32 +41,26 @@ class TestSelectByConstruct:
 class TestSelectByType:
     """Tests for selecting exercises by type."""
 
-    def test_select_by_single_type(self, repo_root: Path) -> None:
+    def test_select_by_single_type(self, selector: ExerciseSelector) -> None:
         """Test selecting exercises by single type."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_type(["modify"])
 
         assert len(exercises) > 0
         # All returned exercises should be modify type
 
-    def test_select_by_multiple_types(self, repo_root: Path) -> None:
+    def test_select_by_multiple_types(self, selector: ExerciseSelector) -> None:
         """Test selecting exercises by multiple types."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_type(["modify", "debug"])
 
         assert len(exercises) > 0
 
-    def test_select_invalid_type(self, repo_root: Path) -> None:
+    def test_select_invalid_type(self, selector: ExerciseSelector) -> None:
         """Test selecting invalid type raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="Invalid type"):
             selector.select_by_type(["invalid_type"])
 
-    def test_select_empty_type_list(self, repo_root: Path) -> None:
+    def test_select_empty_type_list(self, selector: ExerciseSelector) -> None:
         """Test selecting with empty type list raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="At least one type"):
             selector.select_by_type([])
 
@@ -79,9 +68,8 @@ class TestSelectByType:
 class TestSelectByConstructAndType:
     """Tests for selecting exercises by construct AND type."""
 
-    def test_select_by_construct_and_type(self, repo_root: Path) -> None:
+    def test_select_by_construct_and_type(self, selector: ExerciseSelector) -> None:
         """Test intersection of construct and type."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_construct_and_type(
             constructs=["sequence"], types=["modify"]
         )
@@ -89,9 +77,8 @@ class TestSelectByConstructAndType:
         assert len(exercises) > 0
         # All should be sequence AND modify
 
-    def test_select_multiple_constructs_and_types(self, repo_root: Path) -> None:
+    def test_select_multiple_constructs_and_types(self, selector: ExerciseSelector) -> None:
         """Test multiple constructs and types."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_construct_and_type(
             constructs=["sequence", "selection"], types=["modify", "debug"]
         )
@@ -102,34 +89,28 @@ class TestSelectByConstructAndType:
 class TestSelectBySpecificNotebooks:
     """Tests for selecting specific notebooks."""
 
-    def test_select_specific_notebooks(self, repo_root: Path) -> None:
+    def test_select_specific_notebooks(self, selector: ExerciseSelector) -> None:
         """Test selecting explicit notebook list."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_notebooks(["ex001_sanity"])
 
         assert len(exercises) == 1
         assert "ex001_sanity" in exercises[0]
 
-    def test_select_multiple_notebooks(self, repo_root: Path) -> None:
+    def test_select_multiple_notebooks(self, selector: ExerciseSelector) -> None:
         """Test selecting multiple specific notebooks."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_notebooks(
             ["ex001_sanity", "ex002_sequence_modify_basics"]
         )
 
         assert len(exercises) == 2
 
-    def test_select_nonexistent_notebook(self, repo_root: Path) -> None:
+    def test_select_nonexistent_notebook(self, selector: ExerciseSelector) -> None:
         """Test selecting nonexistent notebook raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="not found"):
             selector.select_by_notebooks(["ex999_nonexistent"])
 
-    def test_select_empty_notebook_list(self, repo_root: Path) -> None:
+    def test_select_empty_notebook_list(self, selector: ExerciseSelector) -> None:
         """Test selecting with empty notebook list raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="At least one notebook"):
             selector.select_by_notebooks([])
 
@@ -137,42 +118,78 @@ class TestSelectBySpecificNotebooks:
 class TestSelectByPattern:
     """Tests for selecting notebooks by pattern."""
 
-    def test_select_by_pattern_asterisk(self, repo_root: Path) -> None:
+    def test_select_by_pattern_asterisk(self, selector: ExerciseSelector, notebook_index: tuple[str, ...]) -> None:
         """Test glob pattern matching with asterisk."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_pattern("ex00*")
 
         assert len(exercises) > 0
-        assert all(ex.startswith("ex00") for ex in exercises)
+        assert exercises == sorted(nb for nb in notebook_index if nb.startswith("ex00"))
 
-    def test_select_by_pattern_question_mark(self, repo_root: Path) -> None:
+    def test_select_by_pattern_question_mark(self, selector: ExerciseSelector) -> None:
         """Test glob pattern matching with question mark."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_pattern("ex00?_*")
 
         assert len(exercises) > 0
 
-    def test_select_by_pattern_no_matches(self, repo_root: Path) -> None:
+    def test_select_by_pattern_no_matches(self, selector: ExerciseSelector) -> None:
         """Test pattern with no matches returns empty list."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_pattern("ex999*")
 
         assert len(exercises) == 0
 
-    def test_select_by_pattern_invalid_pattern(self, repo_root: Path) -> None:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            pytest.param("ex01*", ["ex010_b", "ex011_c"], id="literal_prefix"),
+            pytest.param("ex0?0_*", ["ex000_z", "ex010_b"], id="prefix_then_wildcard"),
+            pytest.param("*_b", ["ex010_b"], id="no_prefix"),
+            pytest.param("ex1*", [], id="prefix_past_end"),
+        ],
+    )
+    def test_select_by_pattern_uses_prefix(self, temp_dir: Path, pattern: str, expected: list[str]) -> None:
+        """Test prefix-bounded matching gives the same result as a full scan."""
+        notebooks_dir = temp_dir / "notebooks"
+        notebooks_dir.mkdir()
+        for name in ("ex011_c", "ex000_z", "ex010_b", "ex001_a"):
+            (notebooks_dir / f"{name}.ipynb").write_text("{}")
+
+        assert ExerciseSelector(temp_dir).select_by_pattern(pattern) == expected
+
+    def test_select_by_pattern_invalid_pattern(self, selector: ExerciseSelector) -> None:
         """Test invalid pattern raises ValueError."""
-        selector = ExerciseSelector(repo_root)
-
         with pytest.raises(ValueError, match="Invalid pattern"):
             selector.select_by_pattern("notebooks/ex001")
 
 
+class TestScanNotebooks:
+    """Tests for the cached notebook directory scan."""
+
+    def test_scan_matches_selector(self, selector: ExerciseSelector, notebook_index: tuple[str, ...]) -> None:
+        """Test the selector lists the scanned notebooks."""
+        assert selector.get_all_notebooks() == list(notebook_index)
+
+    def test_scan_sees_new_notebooks(self, temp_dir: Path) -> None:
+        """Test adding a notebook invalidates the cached scan."""
+        (temp_dir / "ex001_a.ipynb").write_text("{}")
+        assert scan_notebooks(temp_dir) == ("ex001_a",)
+
+        (temp_dir / "ex002_b.ipynb").write_text("{}")
+        # Filesystem timestamps can be coarse; make the directory change visible
+        stat = temp_dir.stat()
+        os.utime(temp_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert sorted(scan_notebooks(temp_dir)) == ["ex001_a", "ex002_b"]
+
+    def test_scan_missing_directory(self, shared_empty_dir: Path) -> None:
+        """Test a missing directory scans as empty."""
+        assert scan_notebooks(shared_empty_dir / "missing") == ()
+
+
 class TestSelectEmptyResult:
     """Tests for handling empty selection results."""
 
-    def test_select_returns_empty_gracefully(self, repo_root: Path) -> None:
+    def test_select_returns_empty_gracefully(self, selector: ExerciseSelector) -> None:
         """Test empty result handled gracefully."""
-        selector = ExerciseSelector(repo_root)
         exercises = selector.select_by_pattern("nonexistent*")
 
         assert exercises == []
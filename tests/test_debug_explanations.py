@@ -1,33 +1,52 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 
+import pytest
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
 NOTEBOOK_DIR = Path("notebooks")
+_EXPLANATION_TAG = re.compile(r"explanation\d+")
 
 
 def _find_explanation_cells(nb_path: Path):
-    nb = json.loads(nb_path.read_text(encoding="utf-8"))
+    data = nb_path.read_bytes()
+    # Tags are JSON strings, so a notebook without this substring has no explanation cells
+    if b'"explanation' not in data:
+        return
+    nb = orjson.loads(data) if orjson is not None else json.loads(data)
     for cell in nb.get("cells", []):
         tags = cell.get("metadata", {}).get("tags", [])
         for tag in tags:
-            if re.fullmatch(r"explanation\d+", tag):
+            # Cheap prefix check first; most tags are not explanations
+            if tag.startswith("explanation") and _EXPLANATION_TAG.fullmatch(tag):
                 yield tag, "".join(cell.get("source", []))
 
 
-def test_debug_explanations_have_content() -> None:
+def _student_notebooks() -> list[Path]:
+    """Top-level notebooks only, so the notebooks/solutions/ mirrors are skipped."""
+    if not NOTEBOOK_DIR.is_dir():
+        return []
+    with os.scandir(NOTEBOOK_DIR) as entries:
+        return sorted(Path(e.path) for e in entries if e.name.endswith(".ipynb") and e.is_file())
+
+
+@pytest.mark.parametrize("nb_path", _student_notebooks(), ids=lambda p: p.name)
+def test_debug_explanations_have_content(nb_path: Path) -> None:
     """Ensure any `explanationN` cells are meaningfully filled in.
 
-    This scans notebooks in `notebooks/` (excluding `notebooks/solutions/`) and
+    Runs once per notebook in `notebooks/` (excluding `notebooks/solutions/`) and
     asserts that any cell tagged `explanationN` contains more than 10
     non-whitespace characters. This enforces the instructor requirement that
     students provide a short explanation of what happened when they ran the
     buggy program.
     """
-    for nb_path in NOTEBOOK_DIR.glob("*.ipynb"):
-        # Skip solution mirrors
-        if nb_path.parent.name == "solutions":
-            continue
-        for tag, source in _find_explanation_cells(nb_path):
-            assert len(source.strip()) > 10, f"{nb_path} {tag} must be more than 10 characters"
+    for tag, source in _find_explanation_cells(nb_path):
+        assert len(source.strip()) > 10, f"{nb_path} {tag} must be more than 10 characters"
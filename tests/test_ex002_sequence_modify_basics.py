@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import io
 import math
-import sys
+from collections.abc import Callable
+from contextlib import redirect_stdout
 
 import pytest
 
@@ -11,195 +13,194 @@ from tests.notebook_grader import exec_tagged_code
 
 def _run_and_capture(tag: str) -> str:
     """Execute the tagged cell and capture its print output."""
-    # Capture stdout
-    old_stdout = sys.stdout
-    sys.stdout = buffer = io.StringIO()
-    
-    try:
+    # redirect_stdout rather than capsys: outputs are shared at module scope
+    with redirect_stdout(io.StringIO()) as buffer:
         exec_tagged_code('notebooks/ex002_sequence_modify_basics.ipynb', tag=tag)
-        output = buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
-    
-    return output
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def output_of() -> Callable[[str], str]:
+    """Run each tagged cell at most once and share its output between tests."""
+    return functools.cache(_run_and_capture)
 
 
 # Exercise 1: Change greeting from "Hello World!" to "Hello Python!"
-def test_exercise1_prints_hello_python():
-    output = _run_and_capture('exercise1')
+def test_exercise1_prints_hello_python(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise1')
     assert output.strip() == "Hello Python!", f"Expected 'Hello Python!' but got {output.strip()!r}"
 
 
-def test_exercise1_single_line():
-    output = _run_and_capture('exercise1')
-    lines = output.strip().split('\n')
+def test_exercise1_single_line(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise1')
+    lines = output.strip().splitlines()
     assert len(lines) == 1, "Should print exactly one line"
 
 
-def test_exercise1_exact_match():
-    output = _run_and_capture('exercise1')
+def test_exercise1_exact_match(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise1')
     assert "Hello Python!" in output, "Output must contain 'Hello Python!'"
 
 
 # Exercise 2: Change school name to "Bassaleg School"
-def test_exercise2_prints_bassaleg():
-    output = _run_and_capture('exercise2')
+def test_exercise2_prints_bassaleg(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise2')
     assert output.strip() == "I go to Bassaleg School", f"Expected 'I go to Bassaleg School' but got {output.strip()!r}"
 
 
-def test_exercise2_contains_school():
-    output = _run_and_capture('exercise2')
+def test_exercise2_contains_school(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise2')
     assert "Bassaleg School" in output, "Output must mention 'Bassaleg School'"
 
 
-def test_exercise2_single_line():
-    output = _run_and_capture('exercise2')
-    lines = output.strip().split('\n')
+def test_exercise2_single_line(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise2')
+    lines = output.strip().splitlines()
     assert len(lines) == 1, "Should print exactly one line"
 
 
 # Exercise 3: Change addition to multiplication (5 * 3 = 15)
-def test_exercise3_prints_15():
-    output = _run_and_capture('exercise3')
+def test_exercise3_prints_15(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise3')
     assert output.strip() == "15", f"Expected '15' but got {output.strip()!r}"
 
 
-def test_exercise3_is_multiplication():
-    output = _run_and_capture('exercise3')
+def test_exercise3_is_multiplication(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise3')
     value = int(output.strip())
     assert value == 15, "5 * 3 should equal 15"
 
 
-def test_exercise3_not_addition():
-    output = _run_and_capture('exercise3')
+def test_exercise3_not_addition(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise3')
     value = int(output.strip())
     assert value != 8, "Should not be addition (5 + 3 = 8)"
 
 
 # Exercise 4: Concatenate "Good Morning Everyone"
-def test_exercise4_prints_good_morning():
-    output = _run_and_capture('exercise4')
+def test_exercise4_prints_good_morning(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise4')
     assert output.strip() == "Good Morning Everyone", f"Expected 'Good Morning Everyone' but got {output.strip()!r}"
 
 
-def test_exercise4_has_spaces():
-    output = _run_and_capture('exercise4')
+def test_exercise4_has_spaces(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise4')
     assert " " in output, "Words should be separated by spaces"
 
 
-def test_exercise4_three_words():
-    output = _run_and_capture('exercise4')
+def test_exercise4_three_words(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise4')
     words = output.strip().split()
     assert len(words) == 3, "Should contain exactly 3 words"
 
 
 # Exercise 5: Division 10 / 2 = 5.0
-def test_exercise5_prints_5_point_0():
-    output = _run_and_capture('exercise5')
+def test_exercise5_prints_5_point_0(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise5')
     assert output.strip() == "5.0", f"Expected '5.0' but got {output.strip()!r}"
 
 
-def test_exercise5_is_division():
-    output = _run_and_capture('exercise5')
+def test_exercise5_is_division(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise5')
     value = float(output.strip())
     assert math.isclose(value, 5.0), "10 / 2 should equal 5.0"
 
 
-def test_exercise5_is_float():
-    output = _run_and_capture('exercise5')
+def test_exercise5_is_float(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise5')
     assert ".0" in output or "." in output, "Division should produce a float (decimal number)"
 
 
 # Exercise 6: Three print statements - "Learning", "to", "code rocks"
-def test_exercise6_three_lines():
-    output = _run_and_capture('exercise6')
-    lines = [line for line in output.strip().split('\n') if line]
+def test_exercise6_three_lines(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise6')
+    lines = [line for line in output.strip().splitlines() if line]
     assert len(lines) == 3, f"Expected 3 lines but got {len(lines)}"
 
 
-def test_exercise6_correct_content():
-    output = _run_and_capture('exercise6')
-    lines = [line.strip() for line in output.strip().split('\n') if line]
+def test_exercise6_correct_content(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise6')
+    lines = [line.strip() for line in output.strip().splitlines() if line]
     assert lines[0] == "Learning", f"First line should be 'Learning' but got {lines[0]!r}"
     assert lines[1] == "to", f"Second line should be 'to' but got {lines[1]!r}"
     assert lines[2] == "code rocks", f"Third line should be 'code rocks' but got {lines[2]!r}"
 
 
-def test_exercise6_last_line_two_words():
-    output = _run_and_capture('exercise6')
-    lines = [line.strip() for line in output.strip().split('\n') if line]
+def test_exercise6_last_line_two_words(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise6')
+    lines = [line.strip() for line in output.strip().splitlines() if line]
     last_words = lines[2].split()
     assert len(last_words) == 2, "Last line should contain two words"
 
 
 # Exercise 7: Concatenation "The result is 100"
-def test_exercise7_prints_result_100():
-    output = _run_and_capture('exercise7')
+def test_exercise7_prints_result_100(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise7')
     assert output.strip() == "The result is 100", f"Expected 'The result is 100' but got {output.strip()!r}"
 
 
-def test_exercise7_contains_100():
-    output = _run_and_capture('exercise7')
+def test_exercise7_contains_100(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise7')
     assert "100" in output, "Output must contain '100'"
 
 
-def test_exercise7_contains_result():
-    output = _run_and_capture('exercise7')
+def test_exercise7_contains_result(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise7')
     assert "result" in output.lower(), "Output should mention 'result'"
 
 
 # Exercise 8: Multiplication 2 * 3 * 4 = 24
-def test_exercise8_prints_24():
-    output = _run_and_capture('exercise8')
+def test_exercise8_prints_24(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise8')
     assert output.strip() == "24", f"Expected '24' but got {output.strip()!r}"
 
 
-def test_exercise8_is_multiplication():
-    output = _run_and_capture('exercise8')
+def test_exercise8_is_multiplication(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise8')
     value = int(output.strip())
     assert value == 24, "2 * 3 * 4 should equal 24"
 
 
-def test_exercise8_not_addition():
-    output = _run_and_capture('exercise8')
+def test_exercise8_not_addition(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise8')
     value = int(output.strip())
     assert value != 9, "Should not be addition (2 + 3 + 4 = 9)"
 
 
 # Exercise 9: Two lines - "10 minus 3 equals" and "7"
-def test_exercise9_two_lines():
-    output = _run_and_capture('exercise9')
-    lines = [line for line in output.strip().split('\n') if line]
+def test_exercise9_two_lines(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise9')
+    lines = [line for line in output.strip().splitlines() if line]
     assert len(lines) == 2, f"Expected 2 lines but got {len(lines)}"
 
 
-def test_exercise9_correct_content():
-    output = _run_and_capture('exercise9')
-    lines = [line.strip() for line in output.strip().split('\n') if line]
+def test_exercise9_correct_content(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise9')
+    lines = [line.strip() for line in output.strip().splitlines() if line]
     assert lines[0] == "10 minus 3 equals", f"First line should be '10 minus 3 equals' but got {lines[0]!r}"
     assert lines[1] == "7", f"Second line should be '7' but got {lines[1]!r}"
 
 
-def test_exercise9_calculation_correct():
-    output = _run_and_capture('exercise9')
-    lines = [line.strip() for line in output.strip().split('\n') if line]
+def test_exercise9_calculation_correct(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise9')
+    lines = [line.strip() for line in output.strip().splitlines() if line]
     result = int(lines[1])
     assert result == 7, "10 - 3 should equal 7"
 
 
 # Exercise 10: Concatenation "Welcome to Python programming!"
-def test_exercise10_prints_welcome():
-    output = _run_and_capture('exercise10')
+def test_exercise10_prints_welcome(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise10')
     assert output.strip() == "Welcome to Python programming!", f"Expected 'Welcome to Python programming!' but got {output.strip()!r}"
 
 
-def test_exercise10_has_spaces():
-    output = _run_and_capture('exercise10')
+def test_exercise10_has_spaces(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise10')
     assert output.count(" ") >= 3, "Should have multiple spaces between words"
 
 
-def test_exercise10_ends_with_exclamation():
-    output = _run_and_capture('exercise10')
+def test_exercise10_ends_with_exclamation(output_of: Callable[[str], str]) -> None:
+    output = output_of('exercise10')
     assert output.strip().endswith("!"), "Should end with an exclamation mark"
 
 
@@ -208,8 +209,8 @@ def test_exercise10_ends_with_exclamation():
     'exercise1', 'exercise2', 'exercise3', 'exercise4', 'exercise5',
     'exercise6', 'exercise7', 'exercise8', 'exercise9', 'exercise10'
 ])
-def test_exercise_cells_execute(tag: str) -> None:
+def test_exercise_cells_execute(output_of: Callable[[str], str], tag: str) -> None:
     """Verify each tagged cell executes without error."""
-    output = _run_and_capture(tag)
+    output = output_of(tag)
     assert output is not None, f"{tag} should produce output"
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from tests.notebook_grader import exec_tagged_code
+from tests.notebook_grader import exec_tagged_code, load_cells_by_tag
 
 EXPECTED = {
     "exercise1": "Hi there!",
@@ -26,23 +26,13 @@ def test_exercise_cells_run(tag: str) -> None:
 
 
 # Explanation cell checks for debug exercises
-import json
-
-from tests.notebook_grader import resolve_notebook_path
-
-
 def _get_explanation(notebook_path: str, tag: str = "explanation1") -> str:
-    path = resolve_notebook_path(notebook_path)
-    nb = json.load(open(path, encoding="utf-8"))
-    for cell in nb.get("cells", []):
-        tags = cell.get("metadata", {}).get("tags", [])
-        if tag in tags:
-            return "".join(cell.get("source", []))
-    raise AssertionError(f"No explanation cell with tag {tag}")
+    cell = load_cells_by_tag(notebook_path).get(tag)
+    if cell is None:
+        raise AssertionError(f"No explanation cell with tag {tag}")
+    return "".join(cell.get("source", []))
 
 
-import pytest
-
 PLACEHOLDER = "### What actually happened\nDescribe briefly what happened when you ran the code (include any error messages or incorrect output)."
 TAGS = [f"explanation{i}" for i in range(1, 10 + 1)]
 
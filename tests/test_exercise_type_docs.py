@@ -11,16 +11,17 @@ def test_exercise_type_docs_exist_and_have_headings():
     for path, heading in FILES.items():
         p = Path(path)
         assert p.exists(), f"Missing expected file: {path}"
-        text = p.read_text(encoding="utf-8")
-        assert heading in text, f"Expected heading '{heading}' in {path}"
+        # Plain byte search: the headings are ASCII, so no decode is needed
+        data = p.read_bytes()
+        assert heading.encode() in data, f"Expected heading '{heading}' in {path}"
 
 
 def test_agent_requires_opening_guides():
     p = Path(".github/agents/exercise_generation.md.agent.md")
     assert p.exists(), "Agent instruction file missing"
-    text = p.read_text(encoding="utf-8")
-    assert "MUST" in text, "Expected 'MUST' in agent instructions"
-    assert "docs/exercise-types/debug.md" in text
-    assert "docs/exercise-types/modify.md" in text
-    assert "docs/exercise-types/make.md" in text
-    assert "open and follow" in text or "open and follow the" in text
+    data = p.read_bytes()
+    assert b"MUST" in data, "Expected 'MUST' in agent instructions"
+    assert b"docs/exercise-types/debug.md" in data
+    assert b"docs/exercise-types/modify.md" in data
+    assert b"docs/exercise-types/make.md" in data
+    assert b"open and follow" in data
@@ -4,19 +4,14 @@ import json
 import sys
 
 import scripts.new_exercise as ne
-
-
-def _find_tags(cells, tag):
-    for cell in cells:
-        tags = cell.get("metadata", {}).get("tags", [])
-        if tag in tags:
-            return cell
-    return None
+from tests.notebook_grader import index_cells_by_tag
 
 
 def test_make_notebook_debug_structure():
     nb = ne._make_notebook_with_parts("Title Debug", parts=2, exercise_type="debug")
     cells = nb["cells"]
+    by_tag = index_cells_by_tag(cells)
+    position = {id(cell): i for i, cell in enumerate(cells)}
 
     # For each part check we have expected-output, exercise tag and explanation tag
     for i in range(1, 3):
@@ -24,18 +19,18 @@ def test_make_notebook_debug_structure():
         expl_tag = f"explanation{i}"
 
         # code cell with ex_tag exists
-        code_cell = _find_tags(cells, ex_tag)
+        code_cell = by_tag.get(ex_tag)
         assert code_cell is not None, f"Missing code cell tagged {ex_tag}"
         assert code_cell["cell_type"] == "code"
 
         # markdown explanation cell exists
-        expl_cell = _find_tags(cells, expl_tag)
+        expl_cell = by_tag.get(expl_tag)
         assert expl_cell is not None, f"Missing explanation cell tagged {expl_tag}"
         assert expl_cell["cell_type"] == "markdown"
 
         # Expected output markdown exists prior to the code cell
         # Find index of code cell and check previous cell is markdown containing 'Expected output'
-        idx = cells.index(code_cell)
+        idx = position[id(code_cell)]
         assert idx > 0
         prev_cell = cells[idx - 1]
         assert prev_cell["cell_type"] == "markdown"
@@ -48,8 +43,7 @@ def test_main_creates_debug_files(tmp_path, monkeypatch):
     monkeypatch.setattr(ne, "ROOT", tmp_path)
 
     # Ensure target dirs exist so the script can write files
-    (tmp_path / "tests").mkdir(parents=True)
-    (tmp_path / "notebooks").mkdir(parents=True)
+    (tmp_path / "tests").mkdir()
     (tmp_path / "notebooks" / "solutions").mkdir(parents=True)
 
     # Simulate CLI argv
@@ -74,19 +68,23 @@ def test_main_creates_debug_files(tmp_path, monkeypatch):
     exercise_key = "ex010_debug_example"
     ex_dir = tmp_path / "exercises" / exercise_key
     nb_path = tmp_path / "notebooks" / f"{exercise_key}.ipynb"
-    nb_solution = tmp_path / "notebooks" / "solutions" / f"{exercise_key}.ipynb"
     test_path = tmp_path / "tests" / f"test_{exercise_key}.py"
 
-    assert ex_dir.exists(), "Exercise directory should be created"
-    assert nb_path.exists(), "Student notebook should be created"
-    assert nb_solution.exists(), "Solution notebook should be created"
-    assert test_path.exists(), "Test file should be created"
+    # One walk of the generated tree instead of a stat per expected path
+    created = {p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*")}
+    expected = {
+        f"exercises/{exercise_key}",
+        f"notebooks/{exercise_key}.ipynb",
+        f"notebooks/solutions/{exercise_key}.ipynb",
+        f"tests/test_{exercise_key}.py",
+    }
+    missing = expected - created
+    assert not missing, f"Expected generated paths missing: {sorted(missing)}"
 
     # Notebook should include exercise1 and explanation1 tags
     nb = json.loads(nb_path.read_text(encoding="utf-8"))
-    tags = [t for cell in nb["cells"] for t in cell.get("metadata", {}).get("tags", [])]
-    assert "exercise1" in tags
-    assert "explanation1" in tags
+    tags = {t for cell in nb["cells"] for t in cell.get("metadata", {}).get("tags", [])}
+    assert {"exercise1", "explanation1"} <= tags
 
     # README should mention explanation tag guidance
     readme = (ex_dir / "README.md").read_text(encoding="utf-8")
@@ -94,7 +92,4 @@ def test_main_creates_debug_files(tmp_path, monkeypatch):
 
     # Test file should include an assertion checking explanation content (>10 chars)
     txt = test_path.read_text(encoding="utf-8")
-    assert (
-        "Explanation must be more than 10 characters" in txt
-        or "Explanation must be more than 10 characters" in txt
-    )
+    assert "Explanation must be more than 10 characters" in txt
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import scripts.verify_exercise_quality as vq
+
+
+def _write_notebook(path: Path, source: str) -> Path:
+    metadata = {"language": "python", "tags": ["exercise1"]}
+    cell = {"cell_type": "code", "metadata": metadata, "source": [source]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"cells": [cell], "metadata": {}}), encoding="utf-8")
+    return path
+
+
+def test_verify_one_parses_each_notebook_once(tmp_path, monkeypatch):
+    nb_path = _write_notebook(tmp_path / "notebooks" / "ex001_demo.ipynb", "print(1)")
+    _write_notebook(tmp_path / "notebooks" / "solutions" / "ex001_demo.ipynb", "print(1)")
+    parses: Counter[Path] = Counter()
+    iter_cells = vq._iter_cells
+
+    def counting_iter_cells(path: Path):
+        parses[path] += 1
+        return iter_cells(path)
+
+    monkeypatch.setattr(vq, "_iter_cells", counting_iter_cells)
+
+    vq.verify_one(nb_path, tmp_path, construct="sequence", ex_type="modify")
+
+    assert set(parses.values()) == {1}
+    assert len(parses) == 2
+
+
+def _batch_of_notebooks(root: Path, count: int) -> list[Path]:
+    return [
+        _write_notebook(root / "notebooks" / f"ex{i:03d}_demo.ipynb", f"print({i})")
+        for i in range(1, count + 1)
+    ]
+
+
+def test_verify_many_in_pool_keeps_notebook_order(tmp_path):
+    paths = _batch_of_notebooks(tmp_path, vq._PARALLEL_BATCH_THRESHOLD + 1)
+
+    findings = vq.verify_many(paths, tmp_path, construct="sequence")
+
+    expected = [f for p in paths for f in vq.verify_one(p, tmp_path, construct="sequence")]
+    assert findings == expected
+    # Each notebook reports its own missing mirror, so these follow the input order
+    mirrors = [f.path.name for f in findings if f.message == "Solution mirror notebook not found"]
+    assert mirrors == [p.name for p in paths]
+
+
+def test_verify_many_in_pool_reraises_worker_errors(tmp_path):
+    paths = _batch_of_notebooks(tmp_path, vq._PARALLEL_BATCH_THRESHOLD + 1)
+    paths[3].write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(SystemExit, match="Invalid JSON in notebook"):
+        vq.verify_many(paths, tmp_path)
+
+
+def test_main_batch_fails_when_one_notebook_fails(tmp_path, capsys):
+    paths = _batch_of_notebooks(tmp_path, 3)
+    paths[1].write_text(json.dumps({"metadata": {}}), encoding="utf-8")
+    argv = ["--batch", *map(str, paths), "--repo-root", str(tmp_path)]
+
+    assert vq.main(argv) == 1
+    out = capsys.readouterr().out
+    assert "Notebook has no 'cells' list" in out
+    assert "FAIL: 1 error(s)" in out
+
+
+def test_main_batch_passes_when_all_notebooks_pass(tmp_path, capsys):
+    paths = _batch_of_notebooks(tmp_path, 3)
+
+    assert vq.main(["--batch", *map(str, paths), "--repo-root", str(tmp_path)]) == 0
+    assert "OK:" in capsys.readouterr().out